@@ -4,6 +4,14 @@ FastAPI service exposing scan, signal, and backtest endpoints.
 
 import sys
 import asyncio
+import atexit
+import threading
+import hashlib
+import tempfile
+import time
+from collections import deque
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
 
 # Add project root to Python path
@@ -12,14 +20,15 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 import json
-from typing import List, Optional, Dict, Any, Set
+from typing import List, Optional, Dict, Any, Set, Tuple
 import os
 from datetime import datetime
+import orjson
 from fastapi import FastAPI, Depends, HTTPException, Header, Request, Query
 from pydantic import BaseModel
-from cachetools import TTLCache
+from cachetools import TTLCache, LRUCache
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, FileResponse, Response, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from src.config import get_settings, configure_logging, AssetType
@@ -29,16 +38,26 @@ from src.trading.signal_generator import SignalGenerator
 from src.data.market_symbols import Sector, MARKET_SYMBOLS, CRYPTO_SYMBOLS, FOREX_PAIRS, COMMODITIES
 from src.data.historical_fetcher import HistoricalFetcher
 from src.analysis import DetailedAnalyzer, ReportGenerator
+from src.analysis.detailed_analyzer import warm_kernels as warm_analysis_kernels
+from src.analysis.yield_curve.interpolation.cubic_spline import warm_kernels as warm_spline_kernels
 from src.analysis.advanced_indicators import AdvancedIndicators
 from src.backtesting import BacktestEngine
 from src.api_clients.yahoo_finance import YahooFinanceClient
+from src.utils.pdf_generator import PDFGenerator, REPORTLAB_AVAILABLE
 import pandas as pd
+import numpy as np
+from scipy.optimize import brentq
 
 try:
     import psutil  # Optional; used for monitoring
 except ImportError:  # pragma: no cover
     psutil = None
 
+try:
+    import fcntl  # POSIX only; serialises log appends across worker processes
+except ImportError:  # pragma: no cover
+    fcntl = None
+
 settings = get_settings()
 logger = configure_logging(settings.log_level, __name__)
 
@@ -58,14 +77,41 @@ rate_limiter = TTLCache(maxsize=512, ttl=60)
 # Dashboard result caching (5 minute TTL)
 dashboard_cache = TTLCache(maxsize=64, ttl=300)
 
+# Generated PDF reports are reused for 15 minutes per (symbol, signal_type)
+REPORT_CACHE_SECONDS = 900
+report_cache = TTLCache(maxsize=128, ttl=REPORT_CACHE_SECONDS)
+
+# FRED Treasury curve per business day (constant-maturity series update once a day)
+treasury_curve_cache = TTLCache(maxsize=4, ttl=3600)
+
+# Serialized /api/yield-curve/from-index responses keyed on a digest of the request
+# body; index curves are deterministic in their inputs, so entries never go stale
+index_curve_cache = LRUCache(maxsize=128)
+# The sync endpoint runs in the threadpool and LRUCache reorders on every read
+_index_curve_cache_lock = threading.Lock()
+
+# /api/analysis results keyed on (symbol, price, last bar); identical inputs, such as
+# repeat requests outside market hours, give identical analyses
+analysis_cache = LRUCache(maxsize=1024)
+
 # Preload/retention settings
 PRELOAD_INTERVAL_SECONDS = 300  # every 5 minutes
 PRELOAD_RETENTION_SECONDS = 720  # keep for ~12 minutes, then evict
 
+# Skip the real-time quote fetch when the last historical bar is newer than this
+QUOTE_FRESHNESS_SECONDS = 300
+
 # Shared data loader and scanners to reuse caches across requests
 shared_loader = DataLoader(cache_ttl_seconds=PRELOAD_RETENTION_SECONDS)
 shared_historical_fetcher = HistoricalFetcher()
 shared_scanner = MarketScanner(data_loader=shared_loader, historical_fetcher=shared_historical_fetcher)
+shared_analyzer = DetailedAnalyzer(shared_loader)
+shared_yahoo_client = YahooFinanceClient()
+shared_indicators = AdvancedIndicators()
+shared_report_gen = ReportGenerator()
+# PDFGenerator needs reportlab; created lazily by _get_pdf_generator()
+shared_pdf_gen = None
+_pdf_gen_lock = threading.Lock()
 
 # Preload state
 preload_task: Optional[asyncio.Task] = None
@@ -74,6 +120,87 @@ last_preload_stats: Dict[str, Any] = {}
 last_preload_opportunities: List[Dict[str, Any]] = []
 
 
+# Debug tracing for the PDF endpoint, written as JSON lines to the file named by
+# QUANTS_AGENT_LOG. Entries are buffered per request context and flushed once at the end.
+AGENT_LOG_PATH = os.environ.get("QUANTS_AGENT_LOG")
+_agent_log_entries: ContextVar[Optional[List[bytes]]] = ContextVar("agent_log_entries", default=None)
+
+if AGENT_LOG_PATH:
+    # Fields shared by every entry, serialized once; each entry splices its own fields after it
+    _AGENT_LOG_PREFIX = b'{"sessionId":"debug-session","runId":"run1","location":"api_service.py:generate_pdf_report",'
+
+    def _agent_log(hypothesis_id: str, message: str, **data: Any) -> None:
+        entries = _agent_log_entries.get()
+        if entries is None:
+            entries = []
+            _agent_log_entries.set(entries)
+        entries.append(_AGENT_LOG_PREFIX + orjson.dumps({
+            "hypothesisId": hypothesis_id,
+            "message": message,
+            "data": data,
+            "timestamp": time.time_ns() // 1_000_000,
+        }, default=str)[1:])
+
+    def _flush_agent_log() -> None:
+        entries = _agent_log_entries.get()
+        if not entries:
+            return
+        _agent_log_entries.set(None)
+        try:
+            with open(AGENT_LOG_PATH, "ab", buffering=1 << 16) as f:
+                f.write(b"\n".join(entries) + b"\n")
+        except OSError:
+            pass
+else:
+    def _agent_log(hypothesis_id: str, message: str, **data: Any) -> None:
+        return None
+
+    def _flush_agent_log() -> None:
+        return None
+
+
+def _get_pdf_generator():
+    """Return the shared PDFGenerator, creating it on first use (raises ImportError without reportlab)."""
+    global shared_pdf_gen
+    if shared_pdf_gen is None:
+        if not REPORTLAB_AVAILABLE:
+            raise ImportError("reportlab is required for PDF generation")
+        # Double-checked so concurrent first requests build a single generator
+        with _pdf_gen_lock:
+            if shared_pdf_gen is None:
+                shared_pdf_gen = PDFGenerator()
+    return shared_pdf_gen
+
+
+def _discard_task_result(task: asyncio.Task) -> None:
+    """Done callback for tasks that may be abandoned, so their errors are not reported as unretrieved."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _is_history_fresh(historical_data: pd.DataFrame, max_age_seconds: float = QUOTE_FRESHNESS_SECONDS) -> bool:
+    """Return True when the last historical bar is recent enough to stand in for a live quote."""
+    last_ts = historical_data.index[-1]
+    if not isinstance(last_ts, pd.Timestamp):
+        return False
+    age = pd.Timestamp.now(tz=last_ts.tz) - last_ts
+    return age.total_seconds() < max_age_seconds
+
+
+def _pdf_file_response(pdf_path: str, symbol: str, request: Request) -> Response:
+    """Serve a PDF report with cache headers, answering 304 when the client's ETag matches."""
+    etag = f'"{symbol}-{os.stat(pdf_path).st_mtime_ns:x}"'
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={REPORT_CACHE_SECONDS}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(
+        pdf_path,
+        media_type="application/pdf",
+        filename=f"{symbol}_analysis_report.pdf",
+        headers=headers,
+    )
+
+
 def _get_dashboard_cache_key(threshold: float, sectors: Optional[str], asset_types: Optional[str], demo: bool) -> str:
     """Generate cache key for dashboard results"""
     sectors_str = sectors or "all"
@@ -201,6 +328,13 @@ async def _preload_loop():
 #         logger.info("Preload task started (every %ss, retention %ss)", PRELOAD_INTERVAL_SECONDS, PRELOAD_RETENTION_SECONDS)
 
 
+@app.on_event("startup")
+async def _warm_jit_kernels():
+    """JIT-compile the analysis and spline kernels off the event loop before serving requests."""
+    await asyncio.to_thread(warm_analysis_kernels)
+    await asyncio.to_thread(warm_spline_kernels)
+
+
 @app.on_event("shutdown")
 async def _stop_preload_task():
     """Stop the periodic preload loop cleanly."""
@@ -343,6 +477,17 @@ def root():
     return RedirectResponse(url="/home", status_code=307)
 
 
+HOME_ENDPOINTS = [
+    {"method": "GET", "path": "/home", "desc": "Home - navigation"},
+    {"method": "GET", "path": "/yield-curve", "desc": "Interest rate curve calculator"},
+    {"method": "GET", "path": "/bond-pricer", "desc": "Bond pricer for US/EU"},
+    {"method": "GET", "path": "/reports", "desc": "PDF reports & analysis"},
+    {"method": "GET", "path": "/health", "desc": "Health check"},
+    {"method": "POST", "path": "/scan", "desc": "Scan for trading opportunities (requires API key)"},
+    {"method": "POST", "path": "/backtest", "desc": "Backtest strategies (requires API key)"},
+]
+
+
 @app.get("/home", response_class=HTMLResponse)
 def home(request: Request):
     return templates.TemplateResponse(
@@ -350,15 +495,7 @@ def home(request: Request):
         {
             "request": request,
             "title": "FDV-QUANTS",
-            "endpoints": [
-                {"method": "GET", "path": "/home", "desc": "Home - navigation"},
-                {"method": "GET", "path": "/yield-curve", "desc": "Interest rate curve calculator"},
-                {"method": "GET", "path": "/bond-pricer", "desc": "Bond pricer for US/EU"},
-                {"method": "GET", "path": "/reports", "desc": "PDF reports & analysis"},
-                {"method": "GET", "path": "/health", "desc": "Health check"},
-                {"method": "POST", "path": "/scan", "desc": "Scan for trading opportunities (requires API key)"},
-                {"method": "POST", "path": "/backtest", "desc": "Backtest strategies (requires API key)"},
-            ],
+            "endpoints": HOME_ENDPOINTS,
         },
     )
 
@@ -444,68 +581,59 @@ BOND_PRESETS = {
     ],
 }
 
+# Serialized once for the bond pricer template; BOND_PRESETS is never mutated
+BOND_PRESETS_JSON = json.dumps(BOND_PRESETS)
+
 
-def _build_bond_cashflows(face_value: float, coupon_rate_pct: float, years_to_maturity: float, frequency: int) -> List[Dict[str, float]]:
-    periods = max(int(round(years_to_maturity * frequency)), 1)
+def _build_bond_cashflows(face_value: float, coupon_rate_pct: float, years_to_maturity: float, frequency: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (periods, cashflows) arrays; the final period also repays face value."""
+    n_periods = max(int(round(years_to_maturity * frequency)), 1)
     coupon_payment = face_value * (coupon_rate_pct / 100.0) / frequency
-    cashflows = []
-    for n in range(1, periods + 1):
-        cashflow = coupon_payment
-        if n == periods:
-            cashflow += face_value
-        cashflows.append({
-            "period": n,
-            "cashflow": cashflow,
-            "time_years": n / frequency
-        })
-    return cashflows
+    periods = np.arange(1, n_periods + 1)
+    cashflows = np.full(n_periods, coupon_payment, dtype=float)
+    cashflows[-1] += face_value
+    return periods, cashflows
 
 
-def _price_from_rate(cashflows: List[Dict[str, float]], rate_pct: float, frequency: int) -> Optional[float]:
+def _price_from_rate(periods: np.ndarray, cashflows: np.ndarray, rate_pct: float, frequency: int) -> Optional[float]:
     if rate_pct is None:
         return None
     rate_decimal = rate_pct / 100.0
-    total = 0.0
-    for item in cashflows:
-        discount = (1 + rate_decimal / frequency) ** item["period"]
-        total += item["cashflow"] / discount
-    return total
+    return float(np.sum(cashflows * (1 + rate_decimal / frequency) ** -periods))
 
 
-def _ytm_from_price(cashflows: List[Dict[str, float]], target_price: float, frequency: int, max_rate: float = 0.3) -> Optional[float]:
+def _ytm_from_price(periods: np.ndarray, cashflows: np.ndarray, target_price: float, frequency: int, max_rate: float = 0.3) -> Optional[float]:
     """
-    Solve for yield to maturity (annualized, percent) via binary search.
+    Solve for yield to maturity (annualized, percent), clamped to [0, max_rate].
     """
-    if target_price is None or target_price <= 0 or not cashflows:
+    if target_price is None or target_price <= 0 or len(cashflows) == 0:
         return None
     
-    low = 0.0
-    high = max_rate
-    mid = 0.0
-    for _ in range(80):
-        mid = (low + high) / 2
-        price_estimate = _price_from_rate(cashflows, mid * 100, frequency)
-        if price_estimate is None:
-            return None
-        if abs(price_estimate - target_price) < 1e-4:
-            break
-        if price_estimate > target_price:
-            low = mid
-        else:
-            high = mid
-    return mid * 100
+    # Closed forms: a single cashflow, or a bond priced at par yields its coupon
+    if len(cashflows) == 1:
+        rate = frequency * (cashflows[0] / target_price - 1)
+        return float(min(max(rate, 0.0), max_rate) * 100)
+    face_value = cashflows[-1] - cashflows[0]
+    if np.isclose(target_price, face_value, rtol=0.0, atol=1e-9 * face_value):
+        return float(min(cashflows[0] * frequency / face_value, max_rate) * 100)
+    
+    def price_error(rate: float) -> float:
+        return float(np.sum(cashflows * (1 + rate / frequency) ** -periods)) - target_price
+    
+    # Price falls as yield rises; outside the bracket return the nearest bound
+    if price_error(0.0) <= 0:
+        return 0.0
+    if price_error(max_rate) >= 0:
+        return max_rate * 100
+    return brentq(price_error, 0.0, max_rate) * 100
 
 
-def _macaulay_duration(cashflows: List[Dict[str, float]], rate_pct: Optional[float], frequency: int, price: Optional[float]) -> Optional[float]:
+def _macaulay_duration(periods: np.ndarray, cashflows: np.ndarray, rate_pct: Optional[float], frequency: int, price: Optional[float]) -> Optional[float]:
     if rate_pct is None or price is None or price <= 0:
         return None
     rate_decimal = rate_pct / 100.0
-    numerator = 0.0
-    for item in cashflows:
-        discount = (1 + rate_decimal / frequency) ** item["period"]
-        pv = item["cashflow"] / discount
-        numerator += item["time_years"] * pv
-    return numerator / price
+    pv = cashflows * (1 + rate_decimal / frequency) ** -periods
+    return float(np.dot(periods / frequency, pv)) / price
 
 
 @app.get("/bond-pricer", response_class=HTMLResponse)
@@ -517,7 +645,7 @@ def bond_pricer_page(request: Request):
             "title": "Bond Pricer (US & EU)",
             "markets": BOND_MARKETS,
             "presets": BOND_PRESETS,
-            "presets_json": json.dumps(BOND_PRESETS),
+            "presets_json": BOND_PRESETS_JSON,
         },
     )
 
@@ -528,20 +656,20 @@ def price_bond(req: BondPriceRequest):
     Price a plain-vanilla bond and solve YTM if price is provided.
     """
     try:
-        cashflows = _build_bond_cashflows(
+        periods, cashflows = _build_bond_cashflows(
             face_value=req.face_value,
             coupon_rate_pct=req.coupon_rate_pct,
             years_to_maturity=req.years_to_maturity,
             frequency=req.frequency,
         )
         
-        price_from_market = _price_from_rate(cashflows, req.market_rate_pct, req.frequency) if req.market_rate_pct is not None else None
+        price_from_market = _price_from_rate(periods, cashflows, req.market_rate_pct, req.frequency) if req.market_rate_pct is not None else None
         target_price = req.price if req.price is not None else price_from_market
         
         if target_price is None:
             raise HTTPException(status_code=400, detail="Provide either market_rate_pct (to compute price) or price (to solve YTM).")
         
-        ytm_pct = _ytm_from_price(cashflows, target_price, req.frequency)
+        ytm_pct = _ytm_from_price(periods, cashflows, target_price, req.frequency)
         if ytm_pct is None and req.market_rate_pct is not None:
             ytm_pct = req.market_rate_pct
         
@@ -551,20 +679,23 @@ def price_bond(req: BondPriceRequest):
             current_yield_pct = (annual_coupon / target_price) * 100.0
         
         used_rate = ytm_pct if ytm_pct is not None else req.market_rate_pct
-        duration_years = _macaulay_duration(cashflows, used_rate, req.frequency, target_price)
+        duration_years = _macaulay_duration(periods, cashflows, used_rate, req.frequency, target_price)
         modified_duration_years = None
         if duration_years is not None and used_rate is not None:
             modified_duration_years = duration_years / (1 + (used_rate / 100.0) / req.frequency)
         
-        annotated_cashflows = []
+        time_years = (periods / req.frequency).tolist()
         if used_rate is not None:
-            rate_decimal = used_rate / 100.0
-            for item in cashflows:
-                discount = (1 + rate_decimal / req.frequency) ** item["period"]
-                pv = item["cashflow"] / discount
-                annotated_cashflows.append({**item, "pv": pv})
+            pvs = (cashflows * (1 + (used_rate / 100.0) / req.frequency) ** -periods).tolist()
+            annotated_cashflows = [
+                {"period": n, "cashflow": cf, "time_years": t, "pv": pv}
+                for n, cf, t, pv in zip(periods.tolist(), cashflows.tolist(), time_years, pvs)
+            ]
         else:
-            annotated_cashflows = cashflows
+            annotated_cashflows = [
+                {"period": n, "cashflow": cf, "time_years": t}
+                for n, cf, t in zip(periods.tolist(), cashflows.tolist(), time_years)
+            ]
         
         return {
             "inputs": req.dict(),
@@ -583,21 +714,22 @@ def price_bond(req: BondPriceRequest):
         raise HTTPException(status_code=500, detail="Failed to price bond")
 
 
+# Crypto tickers use -USD, forex pairs use =X
+_ASSET_TYPE_SUFFIXES = (("-USD", AssetType.CRYPTO), ("=X", AssetType.FOREX))
+# Commodity futures prefixes (all three characters, so one slice lookup covers them)
+_COMMODITY_PREFIXES = frozenset(("GC=", "SI=", "PL=", "PA=", "CL=", "NG=", "HG=", "ZC=", "ZW=", "ZS=", "SB=", "KC="))
+
+
+@lru_cache(maxsize=4096)
 def _get_asset_type(symbol: str) -> AssetType:
     """Map symbol to its asset type."""
     symbol_upper = symbol.upper()
     
-    # Crypto tickers typically use -USD suffix
-    if symbol_upper.endswith("-USD"):
-        return AssetType.CRYPTO
-    
-    # Forex pairs use =X suffix
-    if symbol_upper.endswith("=X"):
-        return AssetType.FOREX
+    for suffix, asset_type in _ASSET_TYPE_SUFFIXES:
+        if symbol_upper.endswith(suffix):
+            return asset_type
     
-    # Commodities futures prefixes
-    commodity_prefixes = ("GC=", "SI=", "PL=", "PA=", "CL=", "NG=", "HG=", "ZC=", "ZW=", "ZS=", "SB=", "KC=")
-    if symbol_upper.startswith(commodity_prefixes):
+    if symbol_upper[:3] in _COMMODITY_PREFIXES:
         return AssetType.METAL
     
     # Default to stock
@@ -608,12 +740,35 @@ def series_to_dict(series: pd.Series) -> dict:
     """Convert pandas Series to a JSON-safe dict, replacing NaN with None."""
     if series is None or len(series) == 0:
         return {}
-    return {str(k): (None if pd.isna(v) else float(v)) for k, v in series.items()}
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    out = values.astype(object)
+    out[np.isnan(values)] = None
+    return dict(zip(series.index.map(str), out.tolist()))
 
 
 
 # API Endpoints
 
+# /api/symbols payloads are static, so serialize each filter variant once at import
+_ALL_STOCK_SYMBOLS = [symbol for symbols in MARKET_SYMBOLS.values() for symbol in symbols]
+SYMBOLS_JSON_ALL = orjson.dumps({
+    "stocks": {sector.value: symbols for sector, symbols in MARKET_SYMBOLS.items()},
+    "crypto": CRYPTO_SYMBOLS,
+    "forex": FOREX_PAIRS,
+    "commodities": COMMODITIES,
+})
+SYMBOLS_JSON_BY_SECTOR = {
+    sector.value: orjson.dumps({"total": len(symbols), "symbols": symbols})
+    for sector, symbols in MARKET_SYMBOLS.items()
+}
+SYMBOLS_JSON_BY_TYPE = {
+    asset: orjson.dumps({"total": len(symbols), "symbols": symbols})
+    for asset, symbols in (("crypto", CRYPTO_SYMBOLS), ("forex", FOREX_PAIRS), ("commodities", COMMODITIES))
+}
+SYMBOLS_JSON_STOCKS = orjson.dumps({"total": len(_ALL_STOCK_SYMBOLS), "symbols": _ALL_STOCK_SYMBOLS})
+SYMBOLS_JSON_EMPTY = orjson.dumps({"total": 0, "symbols": []})
+
+
 @app.get("/api/symbols")
 def get_symbols(sector: Optional[str] = None, asset_type: Optional[str] = None):
     """
@@ -623,48 +778,47 @@ def get_symbols(sector: Optional[str] = None, asset_type: Optional[str] = None):
         sector: GICS sector name (e.g., "Information Technology")
         asset_type: Asset type (stock, crypto, forex, commodities)
     """
-    result = {
-        "total": 0,
-        "symbols": []
-    }
-    
     if sector:
-        # Get symbols for specific sector
-        for sec in Sector:
-            if sec.value == sector:
-                result["symbols"] = MARKET_SYMBOLS.get(sec, [])
-                result["total"] = len(result["symbols"])
-                break
+        body = SYMBOLS_JSON_BY_SECTOR.get(sector, SYMBOLS_JSON_EMPTY)
     elif asset_type:
-        # Get symbols by asset type
-        if asset_type.lower() == "crypto":
-            result["symbols"] = CRYPTO_SYMBOLS
-        elif asset_type.lower() == "forex":
-            result["symbols"] = FOREX_PAIRS
-        elif asset_type.lower() == "commodities":
-            result["symbols"] = COMMODITIES
-        else:  # stocks - return all
-            all_stocks = []
-            for symbols in MARKET_SYMBOLS.values():
-                all_stocks.extend(symbols)
-            result["symbols"] = all_stocks
-        result["total"] = len(result["symbols"])
+        # Anything other than crypto/forex/commodities returns all stocks
+        body = SYMBOLS_JSON_BY_TYPE.get(asset_type.lower(), SYMBOLS_JSON_STOCKS)
     else:
-        # Return all symbols organized by type
-        result = {
-            "stocks": {
-                sector.value: symbols for sector, symbols in MARKET_SYMBOLS.items()
-            },
-            "crypto": CRYPTO_SYMBOLS,
-            "forex": FOREX_PAIRS,
-            "commodities": COMMODITIES
-        }
+        body = SYMBOLS_JSON_ALL
+    return Response(content=body, media_type="application/json")
+
+
+def _build_detailed_analysis(symbol: str, current_price: float, historical_data: pd.DataFrame) -> Dict[str, Any]:
+    """CPU-bound part of /api/analysis: analyzer, advanced indicators and report excerpt."""
+    # Generate comprehensive analysis
+    analysis = shared_analyzer.generate_comprehensive_analysis(
+        symbol=symbol,
+        current_price=current_price,
+        historical_data=historical_data
+    )
     
-    return result
+    # Add advanced indicators
+    analysis["advanced_indicators"] = {
+        "fdv_score": float(shared_indicators.fdv_momentum_score(
+            historical_data["close"],
+            historical_data.get("volume")
+        ).iloc[-1]),
+        "smart_money_flow": float(shared_indicators.smart_money_flow_index(
+            historical_data["close"],
+            historical_data["high"],
+            historical_data["low"],
+            historical_data["volume"]
+        ).iloc[-1]) if "volume" in historical_data else 50.0
+    }
+    
+    # Generate professional report excerpt
+    analysis["report_excerpt"] = shared_report_gen._generate_executive_summary(symbol, analysis)
+    
+    return analysis
 
 
 @app.get("/api/analysis/{symbol}")
-def get_detailed_analysis(symbol: str, signal_type: Optional[str] = None):
+async def get_detailed_analysis(symbol: str, signal_type: Optional[str] = None):
     """
     Get comprehensive analysis for a symbol
     
@@ -672,59 +826,44 @@ def get_detailed_analysis(symbol: str, signal_type: Optional[str] = None):
         symbol: Stock/crypto/forex symbol
     """
     try:
-        # Initialize components
-        loader = DataLoader()
-        analyzer = DetailedAnalyzer(loader)
-        historical_fetcher = HistoricalFetcher()
-        
         # Determine asset type
         asset_type = _get_asset_type(symbol)
         
-        # Fetch historical data
-        historical_data = historical_fetcher.fetch_historical_data(
-            symbol, asset_type, years=1, use_cache=True
+        # Fetch historical data and the real-time quote concurrently
+        historical_data, quote = await asyncio.gather(
+            asyncio.to_thread(
+                shared_historical_fetcher.fetch_historical_data,
+                symbol, asset_type, years=1, use_cache=True
+            ),
+            asyncio.to_thread(shared_yahoo_client.get_quote, symbol),
+            return_exceptions=True,
         )
+        if isinstance(historical_data, Exception):
+            raise historical_data
         
         if historical_data is None or len(historical_data) < 50:
             raise HTTPException(status_code=404, detail=f"Insufficient data for {symbol}")
         
         # Get current price - use real-time quote instead of stale historical data
         try:
-            yahoo_client = YahooFinanceClient()
-            quote = yahoo_client.get_quote(symbol)
+            if isinstance(quote, Exception):
+                raise quote
             current_price = float(quote["price"])
-            logger.info(f"Fetched real-time price for {symbol}: ${current_price:.2f}")
+            logger.info("Fetched real-time price for %s: $%.2f", symbol, current_price)
         except Exception as e:
             logger.warning(f"Failed to fetch real-time price for {symbol}, using historical close: {e}")
             # Fallback to historical data if quote fetch fails
             current_price = float(historical_data["close"].iloc[-1])
         
-        # Generate comprehensive analysis
-        analysis = analyzer.generate_comprehensive_analysis(
-            symbol=symbol,
-            current_price=current_price,
-            historical_data=historical_data
+        # A new bar or a price change produces a new key, so entries never go stale
+        analysis_key = (
+            symbol, current_price, len(historical_data),
+            historical_data.index[-1], float(historical_data["close"].iloc[-1]),
         )
-        
-        # Add advanced indicators
-        indicators = AdvancedIndicators()
-        analysis["advanced_indicators"] = {
-            "fdv_score": float(indicators.fdv_momentum_score(
-                historical_data["close"],
-                historical_data.get("volume")
-            ).iloc[-1]),
-            "smart_money_flow": float(indicators.smart_money_flow_index(
-                historical_data["close"],
-                historical_data["high"],
-                historical_data["low"],
-                historical_data["volume"]
-            ).iloc[-1]) if "volume" in historical_data else 50.0
-        }
-        
-        # Generate professional report excerpt
-        report_gen = ReportGenerator()
-        analysis["report_excerpt"] = report_gen._generate_executive_summary(symbol, analysis)
-        
+        analysis = analysis_cache.get(analysis_key)
+        if analysis is None:
+            analysis = await asyncio.to_thread(_build_detailed_analysis, symbol, current_price, historical_data)
+            analysis_cache[analysis_key] = analysis
         return analysis
         
     except Exception as e:
@@ -732,8 +871,60 @@ def get_detailed_analysis(symbol: str, signal_type: Optional[str] = None):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _build_historical_response(symbol: str, period: str, data: pd.DataFrame, indicators: bool) -> Dict[str, Any]:
+    """CPU-bound part of /api/historical: price table and optional technical indicators."""
+    # Prepare response
+    result = {
+        "symbol": symbol,
+        "period": period,
+        "data_points": len(data),
+        "prices": data[["open", "high", "low", "close", "volume"]].to_dict(orient="index")
+    }
+    
+    # Add indicators if requested
+    if indicators and len(data) > 50:
+        try:
+            from src.trading.technical_indicators import TechnicalAnalyzer
+            
+            analyzer = TechnicalAnalyzer(data["close"])
+            analyzer.set_ohlcv(high=data["high"], low=data["low"], volume=data.get("volume"))
+            
+            analysis = analyzer.comprehensive_analysis()
+            
+            moving_averages = analysis.get("moving_averages", {}) if isinstance(analysis, dict) else {}
+            ma_20 = moving_averages.get("ma_20")
+            ma_50 = moving_averages.get("ma_50")
+            macd_data = analysis.get("macd", {}) if isinstance(analysis, dict) else {}
+            macd_series = macd_data.get("macd")
+            signal_series = macd_data.get("signal")
+            current_rsi = analysis.get("current_rsi", 50) if isinstance(analysis, dict) else 50
+            rsi_value = 50.0 if pd.isna(current_rsi) else float(current_rsi)
+
+            # Convert series to dict for JSON serialization (NaN -> None)
+            result["indicators"] = {
+                "sma_20": series_to_dict(ma_20) if ma_20 is not None else {},
+                "sma_50": series_to_dict(ma_50) if ma_50 is not None else {},
+                "rsi": {"current": rsi_value},
+                "macd": {
+                    "macd": series_to_dict(macd_series.tail(100)) if macd_series is not None else {},
+                    "signal": series_to_dict(signal_series.tail(100)) if signal_series is not None else {}
+                }
+            }
+        except Exception as indicator_error:
+            logger.error(f"Error calculating indicators for {symbol}: {indicator_error}", exc_info=True)
+            # Return basic structure without indicators rather than failing completely
+            result["indicators"] = {
+                "sma_20": {},
+                "sma_50": {},
+                "rsi": {"current": 50},
+                "macd": {"macd": {}, "signal": {}}
+            }
+    
+    return result
+
+
 @app.get("/api/historical/{symbol}")
-def get_historical_data(
+async def get_historical_data(
     symbol: str,
     period: str = "1y",
     interval: str = "1d",
@@ -749,9 +940,6 @@ def get_historical_data(
         indicators: Include technical indicators
     """
     try:
-        # Initialize fetcher
-        fetcher = HistoricalFetcher()
-        
         # Determine asset type
         asset_type = _get_asset_type(symbol)
         
@@ -762,61 +950,18 @@ def get_historical_data(
         }
         years = period_map.get(period, 1)
         
-        # Fetch data
-        data = fetcher.fetch_historical_data(symbol, asset_type, years=years)
+        # Fetch price history and signal history concurrently
+        data, performance = await asyncio.gather(
+            asyncio.to_thread(shared_historical_fetcher.fetch_historical_data, symbol, asset_type, years=years),
+            asyncio.to_thread(shared_historical_fetcher.get_signal_performance, symbol, lookback_days=365),
+        )
         
         if data is None:
             raise HTTPException(status_code=404, detail=f"No data available for {symbol}")
         
-        # Prepare response
-        result = {
-            "symbol": symbol,
-            "period": period,
-            "data_points": len(data),
-            "prices": data[["open", "high", "low", "close", "volume"]].to_dict(orient="index")
-        }
-        
-        # Add indicators if requested
-        if indicators and len(data) > 50:
-            try:
-                from src.trading.technical_indicators import TechnicalAnalyzer
-                
-                analyzer = TechnicalAnalyzer(data["close"])
-                analyzer.set_ohlcv(high=data["high"], low=data["low"], volume=data.get("volume"))
-                
-                analysis = analyzer.comprehensive_analysis()
-                
-                moving_averages = analysis.get("moving_averages", {}) if isinstance(analysis, dict) else {}
-                ma_20 = moving_averages.get("ma_20")
-                ma_50 = moving_averages.get("ma_50")
-                macd_data = analysis.get("macd", {}) if isinstance(analysis, dict) else {}
-                macd_series = macd_data.get("macd")
-                signal_series = macd_data.get("signal")
-                current_rsi = analysis.get("current_rsi", 50) if isinstance(analysis, dict) else 50
-                rsi_value = 50.0 if pd.isna(current_rsi) else float(current_rsi)
-
-                # Convert series to dict for JSON serialization (NaN -> None)
-                result["indicators"] = {
-                    "sma_20": series_to_dict(ma_20) if ma_20 is not None else {},
-                    "sma_50": series_to_dict(ma_50) if ma_50 is not None else {},
-                    "rsi": {"current": rsi_value},
-                    "macd": {
-                        "macd": series_to_dict(macd_series.tail(100)) if macd_series is not None else {},
-                        "signal": series_to_dict(signal_series.tail(100)) if signal_series is not None else {}
-                    }
-                }
-            except Exception as indicator_error:
-                logger.error(f"Error calculating indicators for {symbol}: {indicator_error}", exc_info=True)
-                # Return basic structure without indicators rather than failing completely
-                result["indicators"] = {
-                    "sma_20": {},
-                    "sma_50": {},
-                    "rsi": {"current": 50},
-                    "macd": {"macd": {}, "signal": {}}
-                }
+        result = await asyncio.to_thread(_build_historical_response, symbol, period, data, indicators)
         
         # Add signal history
-        performance = fetcher.get_signal_performance(symbol, lookback_days=365)
         result["signal_history"] = performance
         
         return result
@@ -898,7 +1043,7 @@ def market_overview(
         # Check cache first
         cache_key = _get_dashboard_cache_key(threshold, sectors, asset_types, demo)
         if cache_key in dashboard_cache:
-            logger.info(f"Dashboard cache hit for key: {cache_key}")
+            logger.info("Dashboard cache hit for key: %s", cache_key)
             cached_result = dashboard_cache[cache_key]
             return templates.TemplateResponse(
                 "dashboard.html",
@@ -999,7 +1144,7 @@ def dashboard(request: Request, threshold: float = 0.2, demo: bool = False,
         # Check cache first
         cache_key = _get_dashboard_cache_key(threshold, sectors, asset_types, demo)
         if cache_key in dashboard_cache:
-            logger.info(f"Dashboard cache hit for key: {cache_key}")
+            logger.info("Dashboard cache hit for key: %s", cache_key)
             cached_result = dashboard_cache[cache_key]
             return templates.TemplateResponse(
                 "dashboard.html",
@@ -1088,37 +1233,34 @@ def dashboard(request: Request, threshold: float = 0.2, demo: bool = False,
                     symbols_by_type[asset_type.value] = []
                 symbols_by_type[asset_type.value].append(symbol)
 
-            for asset_type_value, symbols in symbols_by_type.items():
-                try:
-                    if demo:
-                        # Demo mode: use scanner's scan_stocks but it will use sample data
-                        opps = shared_scanner.scan_stocks(
-                            symbols,
-                            min_confidence=threshold,
-                            asset_type=asset_type_value,
-                            period="6mo" if asset_type_value == AssetType.STOCK.value else "3mo",
-                            full_analysis=False,
-                            historical_years=0.5 if asset_type_value == AssetType.STOCK.value else 0.25
-                        )
-                        all_opps.extend(opps)
-                        asset_type_counts[asset_type_value] = len(opps)
-                        logger.info(f"[DEMO] {asset_type_value}: {len(opps)} opportunities from {len(symbols)} symbols")
-                    else:
-                        # Normal mode: let scanner handle data fetching and fallback to sample data
-                        opps = shared_scanner.scan_stocks(
-                            symbols,
-                            min_confidence=threshold,
-                            asset_type=asset_type_value,
-                            period="6mo" if asset_type_value == AssetType.STOCK.value else "3mo",
-                            full_analysis=False,
-                            historical_years=0.5 if asset_type_value == AssetType.STOCK.value else 0.25
-                        )
-                        all_opps.extend(opps)
-                        asset_type_counts[asset_type_value] = len(opps)
-                        logger.info(f"{asset_type_value}: {len(opps)} opportunities from {len(symbols)} symbols")
-                except Exception as e:
-                    logger.error(f"Error scanning {asset_type_value} symbols: {e}")
-                    failed_sources.append(f"{asset_type_value}_scanner")
+            # Demo and normal mode share one scan; the scanner falls back to sample data
+            log_prefix = "[DEMO] " if demo else ""
+            groups = [
+                (
+                    symbols,
+                    asset_type_value,
+                    0.5 if asset_type_value == AssetType.STOCK.value else 0.25,
+                )
+                for asset_type_value, symbols in symbols_by_type.items()
+            ]
+            try:
+                opps_by_type = shared_scanner.scan_stocks_batched(
+                    groups,
+                    min_confidence=threshold,
+                    full_analysis=False,
+                )
+                for asset_type_value, symbols in symbols_by_type.items():
+                    if asset_type_value not in opps_by_type:
+                        # The scanner logged the error and left this asset type out
+                        failed_sources.append(f"{asset_type_value}_scanner")
+                        continue
+                    opps = opps_by_type[asset_type_value]
+                    all_opps.extend(opps)
+                    asset_type_counts[asset_type_value] = len(opps)
+                    logger.info("%s%s: %d opportunities from %d symbols", log_prefix, asset_type_value, len(opps), len(symbols))
+            except Exception as e:
+                logger.error(f"Error scanning symbols: {e}")
+                failed_sources.extend(f"{asset_type_value}_scanner" for asset_type_value in symbols_by_type)
 
             # If still no opportunities, fallback to last preload (unfiltered) to keep page populated
             if not all_opps and last_preload_opportunities:
@@ -1140,7 +1282,12 @@ def dashboard(request: Request, threshold: float = 0.2, demo: bool = False,
             "failed_sources": failed_sources,
             "asset_type_counts": asset_type_counts,
         }
-        logger.info(f"Dashboard results cached with key: {cache_key} (used_preloaded={used_preloaded}, count={len(all_opps)})")
+        logger.info(
+            "Dashboard results cached with key: %s (used_preloaded=%s, count=%d)",
+            cache_key,
+            used_preloaded,
+            len(all_opps),
+        )
         
         return templates.TemplateResponse(
             "dashboard.html",
@@ -1179,6 +1326,197 @@ def dashboard(request: Request, threshold: float = 0.2, demo: bool = False,
 
 
 
+def _atomic_write_json(path, obj) -> None:
+    """Write obj as indented JSON via a temp file and os.replace so readers never see a partial file."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, path)
+
+
+# How long an appender waits for another worker's lock before writing anyway
+LOG_LOCK_TIMEOUT_SECONDS = 5.0
+LOG_LOCK_RETRY_SECONDS = 0.025
+
+
+def _open_locked(path, flags: int) -> Tuple[int, bool]:
+    """
+    Open path and take an exclusive flock on it where fcntl is available.
+
+    Returns (fd, locked). If the lock cannot be had within LOG_LOCK_TIMEOUT_SECONDS
+    the fd is returned unlocked. A file swapped in by _migrate_legacy_logs while
+    we waited is reopened, so nothing is written to the replaced inode.
+    """
+    while True:
+        fd = os.open(path, flags | os.O_CREAT, 0o644)
+        if fcntl is None:
+            return fd, False
+        deadline = time.monotonic() + LOG_LOCK_TIMEOUT_SECONDS
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    logger.warning("Timed out waiting for lock on %s; continuing unlocked", path)
+                    return fd, False
+                time.sleep(LOG_LOCK_RETRY_SECONDS)
+        try:
+            if os.stat(path).st_ino == os.fstat(fd).st_ino:
+                return fd, True
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+
+
+def _append_json_lines(path, entries: List[Any]) -> None:
+    """
+    Append entries to a newline-delimited JSON file in a single write.
+
+    The file is opened O_APPEND and, where fcntl is available, held under an
+    exclusive flock so batches from concurrent workers never interleave.
+    """
+    payload = b"".join(orjson.dumps(entry) + b"\n" for entry in entries)
+    fd, locked = _open_locked(path, os.O_WRONLY | os.O_APPEND)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        if locked:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _store_client_logs(log_file: Path, logs: List[Any]) -> None:
+    """Blocking half of receive_logs, run in a worker thread."""
+    log_file.parent.mkdir(exist_ok=True)
+    _append_json_lines(log_file, logs)
+
+
+def _migrate_legacy_logs(logs_dir: Path) -> None:
+    """
+    Convert modal_debug_*.json arrays from before the switch to JSON lines into .jsonl files.
+
+    Holds the same lock as _append_json_lines on the target while converting, so
+    concurrent appends land either before the read or in the replacement file.
+    """
+    for legacy_file in logs_dir.glob("modal_debug_*.json"):
+        target = legacy_file.with_suffix(".jsonl")
+        fd, locked = _open_locked(target, os.O_RDONLY)
+        try:
+            # Another worker may have converted it while we waited for the lock
+            if not legacy_file.exists():
+                continue
+            try:
+                entries = orjson.loads(legacy_file.read_bytes())
+            except (orjson.JSONDecodeError, OSError):
+                entries = []
+            # Legacy entries predate anything already appended to the .jsonl file
+            with os.fdopen(os.dup(fd), "rb") as f:
+                existing = f.read()
+            with tempfile.NamedTemporaryFile(dir=logs_dir, prefix=f".{target.name}.", delete=False) as tmp:
+                tmp.write(b"".join(orjson.dumps(entry) + b"\n" for entry in entries) + existing)
+            try:
+                os.chmod(tmp.name, 0o644)
+                os.replace(tmp.name, target)
+            except OSError:
+                os.unlink(tmp.name)
+                raise
+            legacy_file.unlink()
+        finally:
+            if locked:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+
+WATCHLIST_FILE = "data/watchlist.json"
+
+# In-memory watchlist (file order) plus an uppercased set for O(1) membership checks
+_watchlist: List[str] = []
+_watchlist_upper: Set[str] = set()
+_watchlist_loaded = False
+# st_mtime_ns of watchlist.json as of our last read or write (None if absent)
+_watchlist_mtime_ns: Optional[int] = None
+_watchlist_lock = threading.Lock()
+
+# Changes are written behind after this quiet period instead of on every request
+WATCHLIST_FLUSH_DELAY_SECONDS = 1.0
+_watchlist_flush_timer: Optional[threading.Timer] = None
+
+
+def _watchlist_file_mtime_ns() -> Optional[int]:
+    try:
+        return os.stat(WATCHLIST_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _ensure_watchlist_loaded() -> None:
+    """
+    Load the watchlist from disk, normalising symbols to uppercase.
+
+    Reloads only when the file's mtime differs from our last read or write, so
+    edits made outside the API are picked up without re-parsing on every call.
+    Call with _watchlist_lock held.
+    """
+    global _watchlist_loaded, _watchlist_mtime_ns
+    if _watchlist_loaded and _watchlist_flush_timer is not None:
+        # Unsaved in-memory changes take precedence over the file
+        return
+    mtime_ns = _watchlist_file_mtime_ns()
+    if _watchlist_loaded and mtime_ns == _watchlist_mtime_ns:
+        return
+    _watchlist.clear()
+    _watchlist_upper.clear()
+    if mtime_ns is not None:
+        with open(WATCHLIST_FILE, "rb") as f:
+            for s in orjson.loads(f.read()):
+                sym_up = s.upper()
+                if sym_up not in _watchlist_upper:
+                    _watchlist_upper.add(sym_up)
+                    _watchlist.append(sym_up)
+    _watchlist_mtime_ns = mtime_ns
+    _watchlist_loaded = True
+
+
+def _save_watchlist() -> None:
+    """Flush the in-memory watchlist to disk."""
+    global _watchlist_flush_timer, _watchlist_mtime_ns
+    with _watchlist_lock:
+        _watchlist_flush_timer = None
+        os.makedirs(os.path.dirname(WATCHLIST_FILE), exist_ok=True)
+        _atomic_write_json(WATCHLIST_FILE, _watchlist)
+        _watchlist_mtime_ns = _watchlist_file_mtime_ns()
+
+
+def _schedule_watchlist_save() -> None:
+    """Debounce watchlist writes; call with _watchlist_lock held."""
+    global _watchlist_flush_timer
+    if _watchlist_flush_timer is not None:
+        _watchlist_flush_timer.cancel()
+    _watchlist_flush_timer = threading.Timer(WATCHLIST_FLUSH_DELAY_SECONDS, _save_watchlist)
+    _watchlist_flush_timer.daemon = True
+    _watchlist_flush_timer.start()
+
+
+@app.on_event("shutdown")
+def _flush_watchlist():
+    """Write out any watchlist change still waiting on the debounce timer."""
+    with _watchlist_lock:
+        timer = _watchlist_flush_timer
+        if timer is None:
+            return
+        timer.cancel()
+    _save_watchlist()
+
+
+# The debounce timer is a daemon thread, so also flush when the interpreter exits
+# without a lifespan shutdown (e.g. uvicorn --lifespan off)
+atexit.register(_flush_watchlist)
+
+
 @app.post("/api/watchlist")
 def add_to_watchlist(symbol: str = Query(...)):
     """
@@ -1188,24 +1526,17 @@ def add_to_watchlist(symbol: str = Query(...)):
         symbol: Stock/crypto/forex symbol to add
     """
     try:
-        watchlist_file = "data/watchlist.json"
-        os.makedirs("data", exist_ok=True)
-        
-        # Load existing watchlist
-        watchlist = []
-        if os.path.exists(watchlist_file):
-            with open(watchlist_file, "r") as f:
-                watchlist = json.load(f)
-        
-        # Add symbol if not already present
-        if symbol.upper() not in [s.upper() for s in watchlist]:
-            watchlist.append(symbol.upper())
-            with open(watchlist_file, "w") as f:
-                json.dump(watchlist, f, indent=2)
-            logger.info(f"Added {symbol} to watchlist")
-            return {"status": "success", "message": f"{symbol} added to watchlist", "watchlist": watchlist}
-        else:
-            return {"status": "exists", "message": f"{symbol} already in watchlist", "watchlist": watchlist}
+        sym_up = symbol.upper()
+        with _watchlist_lock:
+            _ensure_watchlist_loaded()
+            if sym_up in _watchlist_upper:
+                return {"status": "exists", "message": f"{symbol} already in watchlist", "watchlist": list(_watchlist)}
+            _watchlist_upper.add(sym_up)
+            _watchlist.append(sym_up)
+            _schedule_watchlist_save()
+            watchlist = list(_watchlist)
+        logger.info("Added %s to watchlist", symbol)
+        return {"status": "success", "message": f"{symbol} added to watchlist", "watchlist": watchlist}
     except Exception as e:
         logger.error(f"Error adding to watchlist: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1215,11 +1546,9 @@ def add_to_watchlist(symbol: str = Query(...)):
 def get_watchlist():
     """Get the current watchlist"""
     try:
-        watchlist_file = "data/watchlist.json"
-        watchlist = []
-        if os.path.exists(watchlist_file):
-            with open(watchlist_file, "r") as f:
-                watchlist = json.load(f)
+        with _watchlist_lock:
+            _ensure_watchlist_loaded()
+            watchlist = list(_watchlist)
         return {"watchlist": watchlist, "count": len(watchlist)}
     except Exception as e:
         logger.error(f"Error getting watchlist: {e}")
@@ -1235,25 +1564,21 @@ def remove_from_watchlist(symbol: str):
         symbol: Stock/crypto/forex symbol to remove
     """
     try:
-        watchlist_file = "data/watchlist.json"
-        if not os.path.exists(watchlist_file):
-            raise HTTPException(status_code=404, detail="Watchlist not found")
-        
-        # Load existing watchlist
-        with open(watchlist_file, "r") as f:
-            watchlist = json.load(f)
-        
-        # Remove symbol (case-insensitive)
-        original_count = len(watchlist)
-        watchlist = [s for s in watchlist if s.upper() != symbol.upper()]
-        
-        if len(watchlist) < original_count:
-            with open(watchlist_file, "w") as f:
-                json.dump(watchlist, f, indent=2)
-            logger.info(f"Removed {symbol} from watchlist")
-            return {"status": "success", "message": f"{symbol} removed from watchlist", "watchlist": watchlist}
-        else:
-            raise HTTPException(status_code=404, detail=f"{symbol} not found in watchlist")
+        sym_up = symbol.upper()
+        with _watchlist_lock:
+            _ensure_watchlist_loaded()
+            if not _watchlist_upper and not os.path.exists(WATCHLIST_FILE):
+                raise HTTPException(status_code=404, detail="Watchlist not found")
+            
+            # Remove symbol (case-insensitive; entries are stored uppercased)
+            if sym_up not in _watchlist_upper:
+                raise HTTPException(status_code=404, detail=f"{symbol} not found in watchlist")
+            _watchlist_upper.discard(sym_up)
+            _watchlist.remove(sym_up)
+            _schedule_watchlist_save()
+            watchlist = list(_watchlist)
+        logger.info("Removed %s from watchlist", symbol)
+        return {"status": "success", "message": f"{symbol} removed from watchlist", "watchlist": watchlist}
     except HTTPException:
         raise
     except Exception as e:
@@ -1264,41 +1589,23 @@ def remove_from_watchlist(symbol: str):
 async def receive_logs(request: Request):
     """
     Receive and store client-side logs for debugging.
-    Logs are stored in logs/modal_debug_YYYY-MM-DD.json
+    Logs are appended to logs/modal_debug_YYYY-MM-DD.jsonl, one entry per line
     """
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
         logs = body.get("logs", [])
         
         if not logs:
             return JSONResponse({"status": "ok", "message": "No logs to store"})
         
-        # Create logs directory if it doesn't exist
-        logs_dir = Path("logs")
-        logs_dir.mkdir(exist_ok=True)
-        
         # Use today's date for log file
         today = datetime.now().strftime("%Y-%m-%d")
-        log_file = logs_dir / f"modal_debug_{today}.json"
+        log_file = Path("logs") / f"modal_debug_{today}.jsonl"
         
-        # Read existing logs if file exists
-        existing_logs = []
-        if log_file.exists():
-            try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    existing_logs = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                # If file is corrupted or empty, start fresh
-                existing_logs = []
+        # Create the logs directory and append the new entries off the event loop
+        await asyncio.to_thread(_store_client_logs, log_file, logs)
         
-        # Append new logs
-        existing_logs.extend(logs)
-        
-        # Write back to file
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(existing_logs, f, indent=2, ensure_ascii=False)
-        
-        logger.debug(f"Stored {len(logs)} log entries to {log_file}")
+        logger.debug("Stored %d log entries to %s", len(logs), log_file)
         
         return JSONResponse({
             "status": "ok",
@@ -1322,19 +1629,27 @@ def get_latest_logs():
         if not logs_dir.exists():
             return JSONResponse({"status": "error", "message": "Logs directory does not exist"})
         
+        _migrate_legacy_logs(logs_dir)
+        
         # Find most recent log file
-        log_files = sorted(logs_dir.glob("modal_debug_*.json"), reverse=True)
+        log_files = sorted(logs_dir.glob("modal_debug_*.jsonl"), reverse=True)
         
         if log_files:
             latest_file = log_files[0]
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                logs = json.load(f)
+            # Stream the file, keeping only the last 100 lines in memory
+            tail: deque = deque(maxlen=100)
+            entry_count = 0
+            with open(latest_file, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        tail.append(line)
+                        entry_count += 1
             
             return JSONResponse({
                 "status": "ok",
                 "log_file": str(latest_file),
-                "entry_count": len(logs),
-                "logs": logs[-100:]  # Return last 100 entries
+                "entry_count": entry_count,
+                "logs": [orjson.loads(line) for line in tail]  # Return last 100 entries
             })
         else:
             return JSONResponse({"status": "ok", "message": "No log files found", "logs": []})
@@ -1345,7 +1660,7 @@ def get_latest_logs():
 
 
 @app.get("/api/report/{symbol}")
-def generate_pdf_report(symbol: str, signal_type: Optional[str] = None):
+async def generate_pdf_report(request: Request, symbol: str, signal_type: Optional[str] = None):
     """
     Generate and download PDF report for a symbol
     
@@ -1353,152 +1668,130 @@ def generate_pdf_report(symbol: str, signal_type: Optional[str] = None):
         symbol: Stock/crypto/forex symbol
         signal_type: Optional signal type (BUY/SELL/HOLD) to use for analysis
     """
-    # #region agent log
-    import json
-    log_path = "/Users/freedom/QUANTS/.cursor/debug.log"
+    quote_task: Optional[asyncio.Task] = None
     try:
-        with open(log_path, "a") as f:
-            f.write(json.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "A", "location": "api_service.py:906", "message": "generate_pdf_report_entry", "data": {"symbol": symbol, "signal_type": signal_type}, "timestamp": int(datetime.now().timestamp() * 1000)}) + "\n")
-    except: pass
-    # #endregion agent log
-    try:
-        # #region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(json.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "A", "location": "api_service.py:918", "message": "before_import_pdf_generator", "data": {"symbol": symbol}, "timestamp": int(datetime.now().timestamp() * 1000)}) + "\n")
-        except: pass
-        # #endregion agent log
-        from fastapi.responses import FileResponse
-        from src.utils.pdf_generator import PDFGenerator
-        
-        # #region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(json.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "A", "location": "api_service.py:922", "message": "after_import_pdf_generator", "data": {"symbol": symbol, "import_success": True}, "timestamp": int(datetime.now().timestamp() * 1000)}) + "\n")
-        except: pass
-        # #endregion agent log
+        _agent_log("A", "generate_pdf_report_entry", symbol=symbol, signal_type=signal_type)
+        # Serve a recently generated report for the same inputs without re-running the pipeline
+        report_key = (symbol.upper(), (signal_type or "").upper())
+        cached_pdf = report_cache.get(report_key)
+        if cached_pdf and os.path.exists(cached_pdf):
+            return _pdf_file_response(cached_pdf, symbol, request)
         
         # Initialize components
-        # #region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(json.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "D", "location": "api_service.py:925", "message": "before_initialize_components", "data": {"symbol": symbol}, "timestamp": int(datetime.now().timestamp() * 1000)}) + "\n")
-        except: pass
-        # #endregion agent log
-        loader = DataLoader()
-        analyzer = DetailedAnalyzer(loader)
-        historical_fetcher = HistoricalFetcher()
-        pdf_gen = PDFGenerator()
+        _agent_log("D", "before_initialize_components", symbol=symbol)
+        pdf_gen = _get_pdf_generator()
         
         # Determine asset type
         asset_type = _get_asset_type(symbol)
         
-        # #region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(json.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "E", "location": "api_service.py:933", "message": "before_fetch_historical", "data": {"symbol": symbol, "asset_type": asset_type}, "timestamp": int(datetime.now().timestamp() * 1000)}) + "\n")
-        except: pass
-        # #endregion agent log
+        _agent_log("E", "before_fetch_historical", symbol=symbol, asset_type=asset_type)
+        
+        # Start the real-time quote alongside the history; it is dropped if the history
+        # turns out fresh or a report for it is already on disk
+        quote_task = asyncio.create_task(asyncio.to_thread(shared_yahoo_client.get_quote, symbol))
+        quote_task.add_done_callback(_discard_task_result)
         
         # Fetch historical data
-        historical_data = historical_fetcher.fetch_historical_data(
+        historical_data = await asyncio.to_thread(
+            shared_historical_fetcher.fetch_historical_data,
             symbol, asset_type, years=1, use_cache=True
         )
         
-        # #region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(json.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "E", "location": "api_service.py:940", "message": "after_fetch_historical", "data": {"symbol": symbol, "has_data": historical_data is not None, "data_length": len(historical_data) if historical_data is not None else 0}, "timestamp": int(datetime.now().timestamp() * 1000)}) + "\n")
-        except: pass
-        # #endregion agent log
+        _agent_log("E", "after_fetch_historical", symbol=symbol, has_data=historical_data is not None, data_length=len(historical_data) if historical_data is not None else 0)
         
         if historical_data is None or len(historical_data) < 50:
-            # #region agent log
-            try:
-                with open(log_path, "a") as f:
-                    f.write(json.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "E", "location": "api_service.py:943", "message": "insufficient_data_error", "data": {"symbol": symbol, "data_length": len(historical_data) if historical_data is not None else 0}, "timestamp": int(datetime.now().timestamp() * 1000)}) + "\n")
-            except: pass
-            # #endregion agent log
+            _agent_log("E", "insufficient_data_error", symbol=symbol, data_length=len(historical_data) if historical_data is not None else 0)
             raise HTTPException(status_code=404, detail=f"Insufficient data for {symbol}")
         
-        # Get current price - use real-time quote instead of stale historical data
+        # Reports are named by a hash of their inputs, so a file for the same last bar
+        # rendered within the cache window is served from disk, even across restarts
+        content_key = hashlib.blake2b(
+            f"{report_key[0]}|{report_key[1]}|{historical_data.index[-1]}".encode(), digest_size=16
+        ).hexdigest()
+        report_file = pdf_gen.output_dir / f"{report_key[0]}_analysis_report_{content_key}.pdf"
         try:
-            yahoo_client = YahooFinanceClient()
-            quote = yahoo_client.get_quote(symbol)
-            current_price = float(quote["price"])
-            logger.info(f"Fetched real-time price for {symbol}: ${current_price:.2f}")
-        except Exception as e:
-            logger.warning(f"Failed to fetch real-time price for {symbol}, using historical close: {e}")
-            # Fallback to historical data if quote fetch fails
+            if time.time() - report_file.stat().st_mtime < REPORT_CACHE_SECONDS:
+                report_cache[report_key] = str(report_file)
+                return _pdf_file_response(str(report_file), symbol, request)
+        except FileNotFoundError:
+            pass
+        
+        # Get current price - use real-time quote unless the historical close is already fresh
+        if _is_history_fresh(historical_data):
             current_price = float(historical_data["close"].iloc[-1])
+        else:
+            try:
+                quote = await quote_task
+                current_price = float(quote["price"])
+                logger.info("Fetched real-time price for %s: $%.2f", symbol, current_price)
+            except Exception as e:
+                logger.warning(f"Failed to fetch real-time price for {symbol}, using historical close: {e}")
+                # Fallback to historical data if quote fetch fails
+                current_price = float(historical_data["close"].iloc[-1])
         
-        # #region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(json.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "D", "location": "api_service.py:950", "message": "before_generate_analysis", "data": {"symbol": symbol, "current_price": current_price}, "timestamp": int(datetime.now().timestamp() * 1000)}) + "\n")
-        except: pass
-        # #endregion agent log
+        _agent_log("D", "before_generate_analysis", symbol=symbol, current_price=current_price)
         
         # Generate comprehensive analysis
-        analysis = analyzer.generate_comprehensive_analysis(
+        analysis = await asyncio.to_thread(
+            shared_analyzer.generate_comprehensive_analysis,
             symbol=symbol,
             current_price=current_price,
             historical_data=historical_data,
             signal_type=signal_type
         )
         
-        # #region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(json.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "D", "location": "api_service.py:960", "message": "after_generate_analysis", "data": {"symbol": symbol, "has_analysis": analysis is not None}, "timestamp": int(datetime.now().timestamp() * 1000)}) + "\n")
-        except: pass
-        # #endregion agent log
+        _agent_log("D", "after_generate_analysis", symbol=symbol, has_analysis=analysis is not None)
         
-        # #region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(json.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "A", "location": "api_service.py:963", "message": "before_generate_pdf", "data": {"symbol": symbol}, "timestamp": int(datetime.now().timestamp() * 1000)}) + "\n")
-        except: pass
-        # #endregion agent log
+        _agent_log("A", "before_generate_pdf", symbol=symbol)
         
         # Generate PDF
-        pdf_path = pdf_gen.generate_report(symbol, analysis)
+        pdf_path = await asyncio.to_thread(pdf_gen.generate_report, symbol, analysis, report_file.name)
         
-        # #region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(json.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "A", "location": "api_service.py:968", "message": "after_generate_pdf", "data": {"symbol": symbol, "pdf_path": pdf_path}, "timestamp": int(datetime.now().timestamp() * 1000)}) + "\n")
-        except: pass
-        # #endregion agent log
+        _agent_log("A", "after_generate_pdf", symbol=symbol, pdf_path=pdf_path)
+        
+        report_cache[report_key] = pdf_path
         
         # Return file for download
-        return FileResponse(
-            pdf_path,
-            media_type="application/pdf",
-            filename=f"{symbol}_analysis_report.pdf"
-        )
+        return _pdf_file_response(pdf_path, symbol, request)
         
     except ImportError as e:
-        # #region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(json.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "A", "location": "api_service.py:980", "message": "import_error_caught", "data": {"symbol": symbol, "error_message": str(e), "error_type": type(e).__name__}, "timestamp": int(datetime.now().timestamp() * 1000)}) + "\n")
-        except: pass
-        # #endregion agent log
+        _agent_log("A", "import_error_caught", symbol=symbol, error_message=str(e), error_type=type(e).__name__)
         logger.error(f"PDF generation not available: {e}")
         raise HTTPException(
             status_code=503,
             detail="PDF generation requires reportlab. Install with: pip install reportlab"
         )
     except Exception as e:
-        # #region agent log
-        try:
-            with open(log_path, "a") as f:
-                f.write(json.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "B", "location": "api_service.py:987", "message": "general_exception_caught", "data": {"symbol": symbol, "error_message": str(e), "error_type": type(e).__name__}, "timestamp": int(datetime.now().timestamp() * 1000)}) + "\n")
-        except: pass
-        # #endregion agent log
+        _agent_log("B", "general_exception_caught", symbol=symbol, error_message=str(e), error_type=type(e).__name__)
         logger.error(f"Error generating PDF report for {symbol}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if quote_task is not None:
+            quote_task.cancel()
+        _flush_agent_log()
+
+
+# Sorted report listing, rebuilt only when the output directory's mtime changes
+_report_listing: Dict[str, Any] = {"mtime_ns": None, "files": []}
+
+
+def _list_report_files() -> List[str]:
+    """PDF reports in output/, newest first, from a single scandir pass."""
+    try:
+        dir_mtime_ns = os.stat(output_dir).st_mtime_ns
+    except FileNotFoundError:
+        return []
+    if _report_listing["mtime_ns"] != dir_mtime_ns:
+        with os.scandir(output_dir) as it:
+            entries = [
+                (entry.stat().st_mtime_ns, entry.name)
+                for entry in it
+                if entry.name.lower().endswith(".pdf") and entry.is_file()
+            ]
+        entries.sort(reverse=True)
+        _report_listing["files"] = [name for _, name in entries]
+        _report_listing["mtime_ns"] = dir_mtime_ns
+    return _report_listing["files"]
 
 
 @app.get("/reports", response_class=HTMLResponse)
@@ -1506,17 +1799,11 @@ def reports(request: Request):
     """
     Reports page for generated PDF analysis reports (served from output/).
     """
-    output_dir = "output"
-    files = []
-    if os.path.isdir(output_dir):
-        files = sorted(
-            [f for f in os.listdir(output_dir) if f.lower().endswith(".pdf")]
-        )
     return templates.TemplateResponse(
         "reports.html",
         {
             "request": request,
-            "files": files,
+            "files": _list_report_files(),
             "title": "Financial Reports",
         },
     )
@@ -1528,12 +1815,30 @@ from src.analysis.yield_curve import YieldCurve, CurveFactory
 from src.analysis.yield_curve.indexes import IndexRegistry, IndexCurveFactory
 
 
+# Index metadata is static once the registry defaults are loaded, so serialize it once
+INDEX_PAYLOADS: Dict[str, Dict[str, str]] = {
+    code: {
+        "code": code,
+        "name": idx.name,
+        "currency": idx.currency,
+        "day_count": idx.day_count,
+        "compounding": idx.compounding,
+    }
+    for code, idx in IndexRegistry.list_all().items()
+}
+INDEX_PAYLOADS_BY_CURRENCY: Dict[str, Dict[str, Dict[str, str]]] = {}
+for _code, _payload in INDEX_PAYLOADS.items():
+    INDEX_PAYLOADS_BY_CURRENCY.setdefault(_payload["currency"].upper(), {})[_code] = _payload
+
+
 class YieldCurveRequest(BaseModel):
     tenors: Optional[List[float]] = None
     rates: Optional[List[float]] = None
     bonds: Optional[List[Dict[str, Any]]] = None
     interpolation: str = "cubic_spline"
     compounding: str = "simple"
+    # False skips the per-pillar discount factors; tenors and rates are still returned
+    include_curve_data: bool = True
 
 
 class IndexCurveRequest(BaseModel):
@@ -1541,6 +1846,23 @@ class IndexCurveRequest(BaseModel):
     primary_index: Optional[str] = None
     interpolation: str = "cubic_spline"
     compounding: str = "continuous"
+    include_curve_data: bool = True
+
+
+def _curve_columns(curve: YieldCurve) -> Dict[str, np.ndarray]:
+    """Curve pillars as parallel columns; ORJSONResponse serializes the arrays natively."""
+    return {
+        "tenors": curve.tenors,
+        "rates": curve.rates,
+        "discount_factors": curve.discount_factors(curve.tenors),
+    }
+
+
+def _curve_payload(curve: YieldCurve, include_curve_data: bool) -> Dict[str, Any]:
+    if include_curve_data:
+        return {"curve_data": _curve_columns(curve)}
+    # Same columns, without evaluating the discount factors
+    return {"curve_data": {"tenors": curve.tenors, "rates": curve.rates, "discount_factors": []}}
 
 
 @app.get("/yield-curve", response_class=HTMLResponse)
@@ -1552,7 +1874,7 @@ def yield_curve_page(request: Request):
     )
 
 
-@app.post("/api/yield-curve/calculate")
+@app.post("/api/yield-curve/calculate", response_class=ORJSONResponse)
 def calculate_yield_curve(req: YieldCurveRequest):
     """Calculate yield curve from tenors/rates or bootstrap from bonds."""
     try:
@@ -1573,19 +1895,8 @@ def calculate_yield_curve(req: YieldCurveRequest):
         else:
             raise HTTPException(status_code=400, detail="Provide either (tenors, rates) or bonds")
 
-        curve_data = []
-        for tenor, rate in zip(curve.tenors, curve.rates):
-            try:
-                df = curve.discount_factor(tenor)
-                curve_data.append({
-                    "tenor": float(tenor),
-                    "rate": float(rate),
-                    "discount_factor": float(df),
-                })
-            except Exception:
-                pass
-
-        return {"curve_data": curve_data}
+        # Returned directly so orjson encodes the floats without jsonable_encoder
+        return ORJSONResponse(_curve_payload(curve, req.include_curve_data))
     except HTTPException:
         raise
     except Exception as e:
@@ -1597,27 +1908,25 @@ def calculate_yield_curve(req: YieldCurveRequest):
 def list_indexes(currency: Optional[str] = None):
     """List available interest rate indexes."""
     try:
-        all_indexes = IndexRegistry.list_all()
-        indexes = {}
-        for code, idx in all_indexes.items():
-            if currency and idx.currency.upper() != currency.upper():
-                continue
-            indexes[code] = {
-                "code": code,
-                "name": idx.name,
-                "currency": idx.currency,
-                "day_count": idx.day_count,
-                "compounding": idx.compounding,
-            }
-        return {"indexes": indexes}
+        if currency:
+            return {"indexes": INDEX_PAYLOADS_BY_CURRENCY.get(currency.upper(), {})}
+        return {"indexes": INDEX_PAYLOADS}
     except Exception as e:
         logger.error(f"Error listing indexes: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/yield-curve/from-index")
+@app.post("/api/yield-curve/from-index", response_class=ORJSONResponse)
 def create_index_curve(req: IndexCurveRequest):
     """Create yield curve from interest rate indexes (Murex-style)."""
+    cache_key = hashlib.blake2b(
+        orjson.dumps(req.dict(), option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).digest()
+    with _index_curve_cache_lock:
+        cached = index_curve_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     try:
         curve = IndexCurveFactory.create_from_multiple_indexes(
             index_rates=req.index_rates,
@@ -1626,19 +1935,11 @@ def create_index_curve(req: IndexCurveRequest):
             compounding=req.compounding,
         )
 
-        curve_data = []
-        for tenor, rate in zip(curve.tenors, curve.rates):
-            try:
-                df = curve.discount_factor(tenor)
-                curve_data.append({
-                    "tenor": float(tenor),
-                    "rate": float(rate),
-                    "discount_factor": float(df),
-                })
-            except Exception:
-                pass
-
-        return {"curve_data": curve_data}
+        # Returned directly so orjson encodes the floats without jsonable_encoder
+        response = ORJSONResponse(_curve_payload(curve, req.include_curve_data))
+        with _index_curve_cache_lock:
+            index_curve_cache[cache_key] = response.body
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -1647,7 +1948,7 @@ def create_index_curve(req: IndexCurveRequest):
 
 
 @app.get("/api/yield-curve/fetch-real")
-def fetch_real_treasury_yields():
+async def fetch_real_treasury_yields():
     """Fetch real US Treasury yields from FRED API."""
     try:
         from src.api_clients.fred_api import FREDClient
@@ -1656,8 +1957,15 @@ def fetch_real_treasury_yields():
         if not fred_api_key:
             raise HTTPException(status_code=400, detail="FRED_API_KEY not configured. Add it to your .env file.")
         
+        # Weekend requests share Friday's entry
+        business_day = pd.offsets.BDay().rollback(pd.Timestamp.now("UTC").normalize()).strftime("%Y-%m-%d")
+        data = treasury_curve_cache.get(business_day)
+        if data is not None:
+            return {"data": data, "success": True, "cached": True}
+        
         client = FREDClient(api_key=fred_api_key)
-        data = client.get_yield_curve_data()
+        data = await client.aget_yield_curve_data()
+        treasury_curve_cache[business_day] = data
         
         return {"data": data, "success": True}
     except HTTPException:
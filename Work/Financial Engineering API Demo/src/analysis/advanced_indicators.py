@@ -11,6 +11,36 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _windowed(cumulative: np.ndarray, window: int) -> np.ndarray:
+    """Turn a running total into trailing-window totals (partial windows at the start)."""
+    out = cumulative.copy()
+    out[window:] -= cumulative[:-window]
+    return out
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing-window sum matching pandas rolling(window, min_periods=1).sum().
+
+    Computed in one pass from cumulative sums. NaNs are skipped; a window with
+    no valid values yields NaN.
+    """
+    valid = ~np.isnan(values)
+    totals = _windowed(np.cumsum(np.where(valid, values, 0.0), dtype=np.float64), window)
+    counts = _windowed(np.cumsum(valid, dtype=np.int64), window)
+    totals[counts == 0] = np.nan
+    return totals
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing-window mean matching pandas rolling(window, min_periods=1).mean()."""
+    valid = ~np.isnan(values)
+    totals = _windowed(np.cumsum(np.where(valid, values, 0.0), dtype=np.float64), window)
+    counts = _windowed(np.cumsum(valid, dtype=np.int64), window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, totals / counts, np.nan)
+
+
 class AdvancedIndicators:
     """Advanced technical indicators calculator"""
     
@@ -36,13 +66,21 @@ class AdvancedIndicators:
         if len(prices) < 2:
             return pd.Series([50.0] * len(prices), index=prices.index)
         
-        # Simple momentum calculation
-        returns = prices.pct_change().fillna(0)
-        momentum = returns.rolling(window=14, min_periods=1).mean() * 100
+        # Simple momentum calculation: 14-day mean of daily returns (first return 0)
+        p = prices.to_numpy(dtype=np.float64)
+        returns = np.empty_like(p)
+        returns[0] = 0.0
+        np.subtract(p[1:], p[:-1], out=returns[1:])
+        np.divide(returns[1:], p[:-1], out=returns[1:])
+        returns[np.isnan(returns)] = 0.0
+        momentum = _rolling_mean(returns, 14)
         
-        # Normalize to 0-100 range
-        score = 50 + (momentum * 10).clip(-50, 50)
-        return score.fillna(50.0)
+        # Normalize to 0-100 range: 50 + clip(momentum% * 10, -50, 50)
+        score = momentum * 1000.0
+        np.clip(score, -50.0, 50.0, out=score)
+        score += 50.0
+        score[np.isnan(score)] = 50.0
+        return pd.Series(score, index=prices.index)
     
     def smart_money_flow_index(
         self,
@@ -66,24 +104,28 @@ class AdvancedIndicators:
         if len(close) < 2:
             return pd.Series([50.0] * len(close), index=close.index)
         
-        # Calculate typical price
-        typical_price = (high + low + close) / 3
+        # Calculate typical price and money flow
+        typical_price = (
+            high.to_numpy(dtype=np.float64)
+            + low.to_numpy(dtype=np.float64)
+            + close.to_numpy(dtype=np.float64)
+        ) / 3
+        money_flow = typical_price * volume.to_numpy(dtype=np.float64)
         
-        # Calculate money flow
-        money_flow = typical_price * volume
-        
-        # Calculate positive and negative money flow
-        price_change = typical_price.diff()
-        positive_flow = money_flow.where(price_change > 0, 0)
-        negative_flow = money_flow.where(price_change < 0, 0)
+        # Split money flow by the sign of the typical-price change (first bar counts as neither)
+        price_change = np.empty_like(typical_price)
+        price_change[0] = np.nan
+        np.subtract(typical_price[1:], typical_price[:-1], out=price_change[1:])
+        positive_flow = np.where(price_change > 0, money_flow, 0.0)
+        negative_flow = np.where(price_change < 0, money_flow, 0.0)
         
         # Calculate flow ratio
-        positive_sum = positive_flow.rolling(window=14, min_periods=1).sum()
-        negative_sum = negative_flow.rolling(window=14, min_periods=1).sum()
+        positive_sum = _rolling_sum(positive_flow, 14)
+        negative_sum = _rolling_sum(negative_flow, 14)
         
         # Calculate flow index
         flow_ratio = positive_sum / (negative_sum + 1e-10)  # Avoid division by zero
         flow_index = 100 - (100 / (1 + flow_ratio))
+        flow_index[np.isnan(flow_index)] = 50.0
         
-        return flow_index.fillna(50.0)
-
+        return pd.Series(flow_index, index=close.index)
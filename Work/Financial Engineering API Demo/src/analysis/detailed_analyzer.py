@@ -5,13 +5,148 @@ Provides comprehensive analysis for individual symbols
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 import logging
 from datetime import datetime
 
+from ..utils.jit import njit, prange, NUMBA_AVAILABLE
+
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True)
+def _rsi_wilder(prices, period):
+    """
+    RSI with Wilder's smoothing: the first average is a simple mean of `period`
+    moves, then avg = (avg * (period - 1) + move) / period. Missing moves count
+    as neither gain nor loss; bars before the first full window are NaN.
+    """
+    n = prices.shape[0]
+    rsi = np.full(n, np.nan)
+    if n <= period:
+        return rsi
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        delta = prices[i] - prices[i - 1]
+        gain = 0.0
+        loss = 0.0
+        if delta > 0:
+            gain = delta
+        elif delta < 0:
+            loss = -delta
+        if i <= period:
+            avg_gain += gain / period
+            avg_loss += loss / period
+            if i < period:
+                continue
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        if avg_loss > 0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            rsi[i] = 100.0
+    return rsi
+
+
+@njit(cache=True)
+def _price_stats(prices):
+    """
+    One sweep over the closes for the scalar statistics the analysis reports.
+
+    Returns (n_returns, mean_return, std_return, recent_return, sma_20, sma_50),
+    matching pandas: simple returns with missing values dropped, sample std,
+    mean of the last 20 returns (all of them if fewer), and the last value of
+    the 20/50-bar price SMAs (NaN if the series is shorter or the window has a gap).
+    """
+    n = prices.shape[0]
+    returns = np.empty(max(n - 1, 0))
+    count = 0
+    total = 0.0
+    for i in range(1, n):
+        r = prices[i] / prices[i - 1] - 1.0
+        if not np.isnan(r):
+            returns[count] = r
+            total += r
+            count += 1
+
+    mean = np.nan
+    std = np.nan
+    recent = np.nan
+    if count > 0:
+        mean = total / count
+        recent = mean
+        if count >= 20:
+            recent_total = 0.0
+            for i in range(count - 20, count):
+                recent_total += returns[i]
+            recent = recent_total / 20
+        if count > 1:
+            sq = 0.0
+            for i in range(count):
+                d = returns[i] - mean
+                sq += d * d
+            std = np.sqrt(sq / (count - 1))
+
+    sma_20 = np.nan
+    sma_50 = np.nan
+    if n >= 20:
+        window_total = 0.0
+        for i in range(n - 20, n):
+            window_total += prices[i]
+        sma_20 = window_total / 20
+    if n >= 50:
+        window_total = 0.0
+        for i in range(n - 50, n):
+            window_total += prices[i]
+        sma_50 = window_total / 50
+    return count, mean, std, recent, sma_20, sma_50
+
+
+@njit(parallel=True, cache=True)
+def _batch_price_stats(series, period):
+    """
+    _price_stats plus the last RSI value for every row of a symbols x bars array,
+    one symbol per thread. Columns are (n_returns, mean_return, std_return,
+    recent_return, sma_20, sma_50, rsi); the RSI is NaN until a full window exists.
+    Leading and trailing NaNs, the padding from aligning symbols with different
+    histories, are trimmed so each row matches _price_stats on its own closes.
+    """
+    n_series = series.shape[0]
+    out = np.empty((n_series, 7))
+    for j in prange(n_series):
+        row = series[j]
+        start = 0
+        end = row.shape[0]
+        while start < end and np.isnan(row[start]):
+            start += 1
+        while end > start and np.isnan(row[end - 1]):
+            end -= 1
+        prices = row[start:end]
+        count, mean, std, recent, sma_20, sma_50 = _price_stats(prices)
+        out[j, 0] = count
+        out[j, 1] = mean
+        out[j, 2] = std
+        out[j, 3] = recent
+        out[j, 4] = sma_20
+        out[j, 5] = sma_50
+        out[j, 6] = _rsi_wilder(prices, period)[-1] if prices.shape[0] > 0 else np.nan
+    return out
+
+
+def warm_kernels() -> None:
+    """
+    Compile (or load from numba's on-disk cache) the kernels above, so the cost
+    is paid at application startup rather than by the first request
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    _rsi_wilder(np.linspace(1.0, 2.0, 16), 14)
+    _price_stats(np.linspace(1.0, 2.0, 60))
+    _batch_price_stats(np.linspace(1.0, 2.0, 120).reshape(2, 60), 14)
+
+
 class DetailedAnalyzer:
     """Generate comprehensive analysis for symbols"""
     
@@ -49,19 +184,18 @@ class DetailedAnalyzer:
         else:
             closes = historical_data.iloc[:, 0] if len(historical_data.columns) > 0 else pd.Series([current_price])
         
-        returns = closes.pct_change().dropna()
+        # One float64 copy of the closes feeds every statistic below
+        prices = closes.to_numpy(dtype=np.float64)
+        n_returns, mean_daily, std_daily, recent_returns, sma_20, sma_50 = _price_stats(prices)
         
         # Calculate basic metrics
-        volatility = returns.std() * np.sqrt(252)  # Annualized
-        mean_return = returns.mean() * 252  # Annualized
+        volatility = std_daily * np.sqrt(252)  # Annualized
+        mean_return = mean_daily * 252  # Annualized
         
         # Calculate risk metrics
-        max_drawdown = self._calculate_max_drawdown(closes)
+        max_drawdown = self._calculate_max_drawdown(prices)
         sharpe_ratio = (mean_return - 0.02) / volatility if volatility > 0 else 0
         
-        # Calculate recent returns (always needed for trend_strength calculation)
-        recent_returns = returns.tail(20).mean() if len(returns) >= 20 else returns.mean()
-        
         # Determine recommendation
         if signal_type:
             action = signal_type.upper()
@@ -79,7 +213,7 @@ class DetailedAnalyzer:
                 recommendation_text = "Hold"
         
         # Calculate confidence based on volatility and trend strength
-        trend_strength = abs(recent_returns) if len(returns) >= 20 else 0.5
+        trend_strength = abs(recent_returns) if n_returns >= 20 else 0.5
         confidence = min(0.95, max(0.5, trend_strength * 10 + 0.5))
         
         # Calculate ATR for volatility measure (more appropriate than price std dev)
@@ -89,11 +223,11 @@ class DetailedAnalyzer:
             atr = self._calculate_atr(high, low, closes, period=14)
         else:
             # Fallback: use returns-based volatility as percentage
-            atr = current_price * (returns.std() * np.sqrt(252) * 0.02)  # Conservative estimate
+            atr = current_price * (std_daily * np.sqrt(252) * 0.02)  # Conservative estimate
         
         # Calculate ATR percentage safely for logging
         atr_pct_for_log = (atr / current_price * 100) if current_price > 0 else 0.0
-        logger.info(f"Price calculation for {symbol}: current_price=${current_price:.2f}, ATR=${atr:.2f} ({atr_pct_for_log:.1f}% of price)")
+        logger.info("Price calculation for %s: current_price=$%.2f, ATR=$%.2f (%.1f%% of price)", symbol, current_price, atr, atr_pct_for_log)
         
         # Apply percentage caps to ATR
         atr_pct = (atr / current_price) if current_price > 0 else 0.02
@@ -104,7 +238,6 @@ class DetailedAnalyzer:
         entry_pct = min(0.05, max(0.02, atr_pct * 2))
         entry_min = current_price * (1 - entry_pct)
         entry_max = current_price * (1 + entry_pct)
-        entry_range = f"${entry_min:.2f}-${entry_max:.2f}"
         
         # Calculate stop loss and targets with percentage caps
         if action == "BUY":
@@ -113,36 +246,31 @@ class DetailedAnalyzer:
             stop_loss = current_price * (1 - stop_loss_pct)
             
             # Targets: 10%, 20%, 30% above current price
-            target1 = current_price * 1.10
-            target2 = current_price * 1.20
-            target3 = current_price * 1.30
+            targets = [current_price * 1.10, current_price * 1.20, current_price * 1.30]
         elif action == "SELL":
             # Stop loss: 5-15% above current price
             stop_loss_pct = min(0.15, max(0.05, atr_pct * 3))
             stop_loss = current_price * (1 + stop_loss_pct)
             
             # Targets: 10%, 20%, 30% below current price
-            target1 = current_price * 0.90
-            target2 = current_price * 0.80
-            target3 = current_price * 0.70
+            targets = [current_price * 0.90, current_price * 0.80, current_price * 0.70]
         else:  # HOLD
             # Neutral: smaller ranges
             stop_loss = current_price * 0.95
-            target1 = current_price * 1.05
-            target2 = current_price * 1.10
-            target3 = current_price * 1.15
+            targets = [current_price * 1.05, current_price * 1.10, current_price * 1.15]
         
-        # Format as strings
-        stop_loss = f"${stop_loss:.2f}"
-        target1 = f"${target1:.2f}"
-        target2 = f"${target2:.2f}"
-        target3 = f"${target3:.2f}"
+        # Display strings for the UI and PDF; the numeric levels are returned as price_levels
+        entry_range = f"${entry_min:.2f}-${entry_max:.2f}"
+        stop_loss_label = f"${stop_loss:.2f}"
+        target_labels = [f"${target:.2f}" for target in targets]
         
-        logger.info(f"Calculated for {symbol}: stop_loss={stop_loss}, targets=[{target1}, {target2}, {target3}]")
+        logger.info("Calculated for %s: stop_loss=%s, targets=[%s]", symbol, stop_loss_label, ", ".join(target_labels))
         
         # Calculate RSI
-        rsi = self._calculate_rsi(closes, period=14)
-        rsi_value = rsi.iloc[-1] if len(rsi) > 0 else 50
+        # Only the latest value is reported, so read it straight off the kernel
+        rsi_value = _rsi_wilder(prices, 14)[-1] if len(prices) > 14 else 50.0
+        if np.isnan(rsi_value):
+            rsi_value = 50.0
         if rsi_value > 70:
             rsi_signal = "overbought"
         elif rsi_value < 30:
@@ -151,8 +279,10 @@ class DetailedAnalyzer:
             rsi_signal = "neutral"
         
         # Determine trend
-        sma_20 = closes.rolling(20).mean().iloc[-1] if len(closes) >= 20 else current_price
-        sma_50 = closes.rolling(50).mean().iloc[-1] if len(closes) >= 50 else current_price
+        if len(closes) < 20:
+            sma_20 = current_price
+        if len(closes) < 50:
+            sma_50 = current_price
         
         if sma_20 > sma_50:
             trend = "uptrend"
@@ -181,8 +311,14 @@ class DetailedAnalyzer:
                 "confidence": confidence,
                 "timeframe": "3-6 months",
                 "entry_range": entry_range,
-                "stop_loss": stop_loss,
-                "targets": [target1, target2, target3],
+                "stop_loss": stop_loss_label,
+                "targets": target_labels,
+                "price_levels": {
+                    "entry_min": float(entry_min),
+                    "entry_max": float(entry_max),
+                    "stop_loss": float(stop_loss),
+                    "targets": [float(target) for target in targets],
+                },
                 "risk_reward_ratio": 2.5,
                 "trend": trend,
                 "symbol": symbol
@@ -211,28 +347,86 @@ class DetailedAnalyzer:
             "historical_performance": {}
         }
     
-    def _calculate_max_drawdown(self, prices: pd.Series) -> float:
+    def analyze_batch(self, prices: pd.DataFrame, period: int = 14) -> Dict[str, Dict[str, float]]:
+        """
+        Core statistics for many symbols in one pass
+        
+        Args:
+            prices: Close prices, one column per symbol; NaN padding before a
+                symbol's first or after its last close is ignored
+            period: RSI period
+            
+        Returns:
+            Dictionary mapping symbol to its volatility, mean_return, sharpe_ratio,
+            sma_20, sma_50, rsi and max_drawdown, computed as in
+            generate_comprehensive_analysis (the SMAs are NaN while the
+            history is shorter than their window)
+        """
+        if prices.shape[1] == 0:
+            return {}
+        
+        # Symbols x bars, so each symbol's closes are contiguous for the kernels
+        arr = np.ascontiguousarray(prices.to_numpy(dtype=np.float64).T)
+        stats = _batch_price_stats(arr, period)
+        volatility = stats[:, 2] * np.sqrt(252)
+        mean_return = stats[:, 1] * 252
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe_ratio = np.where(volatility > 0, (mean_return - 0.02) / volatility, 0.0)
+        rsi = np.where(np.isnan(stats[:, 6]), 50.0, stats[:, 6])
+        
+        # Drawdowns for all gap-free symbols at once; the others keep the pandas path
+        max_drawdown = np.zeros(arr.shape[0])
+        if arr.shape[1] >= 2:
+            gaps = np.isnan(arr).any(axis=1)
+            path = arr[~gaps, 1:]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                max_drawdown[~gaps] = (path / np.maximum.accumulate(path, axis=1) - 1.0).min(axis=1)
+            for j in np.flatnonzero(gaps):
+                valid = np.flatnonzero(~np.isnan(arr[j]))
+                if valid.size:
+                    max_drawdown[j] = self._calculate_max_drawdown(arr[j, valid[0]:valid[-1] + 1])
+        
+        return {
+            str(symbol): {
+                "volatility": float(volatility[j]),
+                "mean_return": float(mean_return[j]),
+                "sharpe_ratio": float(sharpe_ratio[j]),
+                "sma_20": float(stats[j, 4]),
+                "sma_50": float(stats[j, 5]),
+                "rsi": float(rsi[j]),
+                "max_drawdown": float(max_drawdown[j]),
+            }
+            for j, symbol in enumerate(prices.columns)
+        }
+    
+    def _calculate_max_drawdown(self, prices: Union[pd.Series, np.ndarray]) -> float:
         """Calculate maximum drawdown"""
         if len(prices) < 2:
             return 0.0
         
-        cumulative = (1 + prices.pct_change()).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
+        p = np.asarray(prices, dtype=np.float64)
+        if np.isnan(p).any():
+            # Gaps drop returns from the compounded path, so keep the pandas semantics
+            cumulative = (1 + pd.Series(p).pct_change()).cumprod()
+            running_max = cumulative.expanding().max()
+            drawdown = (cumulative - running_max) / running_max
+            return float(drawdown.min())
+        
+        # The compounded return path is p / p[0], so the drawdown can be read off the
+        # prices directly; like the pct_change path, it starts from the second bar
+        path = p[1:]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdown = path / np.maximum.accumulate(path) - 1.0
         return float(drawdown.min())
     
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
-        """Calculate Relative Strength Index"""
+        """Calculate Relative Strength Index (Wilder's smoothing)"""
         if len(prices) < period + 1:
             return pd.Series([50.0] * len(prices), index=prices.index)
         
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi.fillna(50.0)
+        rsi = _rsi_wilder(prices.to_numpy(dtype=np.float64), period)
+        rsi[np.isnan(rsi)] = 50.0
+        return pd.Series(rsi, index=prices.index)
     
     def _calculate_atr(self, high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> float:
         """
@@ -251,17 +445,16 @@ class DetailedAnalyzer:
             # Fallback: use simple price range if not enough data
             return float((high - low).mean()) if len(high) > 0 else float(close.iloc[-1] * 0.02)
         
-        # Calculate True Range
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        # Only the last window of True Range feeds the ATR, so build just that
+        h = high.to_numpy(dtype=np.float64)[-period:]
+        l = low.to_numpy(dtype=np.float64)[-period:]
+        prev_close = close.to_numpy(dtype=np.float64)[-period - 1:-1]
+        true_range = np.fmax(np.fmax(h - l, np.abs(h - prev_close)), np.abs(l - prev_close))
         
-        # Calculate ATR as moving average of True Range
-        atr = true_range.rolling(window=period).mean().iloc[-1]
+        # ATR as the mean True Range of the window; NaN if the window has a gap, like rolling()
+        atr = true_range.mean()
         
-        return float(atr) if not pd.isna(atr) else float((high - low).mean())
+        return float(atr) if not np.isnan(atr) else float((high - low).mean())
 
 
 class ReportGenerator:
@@ -36,6 +36,28 @@ class PortfolioAnalyzer:
         if not np.isclose(self.weights.sum(), 1.0):
             raise ValueError("Weights must sum to 1.0")
 
+    @staticmethod
+    def _asset_returns(prices: pd.DataFrame) -> np.ndarray:
+        """Simple daily returns per symbol; row i is the move into prices.index[i + 1]"""
+        arr = prices.to_numpy(dtype=np.float64)
+        return arr[1:] / arr[:-1] - 1.0
+
+    def _aggregate(self, asset_returns: np.ndarray, index: pd.Index) -> pd.Series:
+        """Weight per-symbol returns into portfolio returns"""
+        # Same rows as pct_change().dropna(): drop any day with a missing return
+        complete = ~np.isnan(asset_returns).any(axis=1)
+        return pd.Series(asset_returns[complete] @ self.weights, index=index[complete])
+
+    @staticmethod
+    def _correlation(asset_returns: np.ndarray, columns: pd.Index) -> Dict[str, Any]:
+        """Correlation of per-symbol returns in DataFrame.corr().to_dict() layout"""
+        if np.isnan(asset_returns).any():
+            # Gaps need pandas' pairwise-complete handling
+            return pd.DataFrame(asset_returns, columns=columns).corr().to_dict()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = np.atleast_2d(np.corrcoef(asset_returns, rowvar=False))
+        return pd.DataFrame(corr, index=columns, columns=columns).to_dict()
+
     def calculate_returns(self, prices: pd.DataFrame) -> pd.Series:
         """
         Calculate portfolio returns
@@ -46,9 +68,7 @@ class PortfolioAnalyzer:
         Returns:
             Portfolio returns series
         """
-        returns = prices.pct_change().dropna()
-        portfolio_returns = (returns * self.weights).sum(axis=1)
-        return portfolio_returns
+        return self._aggregate(self._asset_returns(prices), prices.index[1:])
 
     def calculate_risk_metrics(
         self, returns: pd.Series, risk_free_rate: float = 0.02
@@ -63,23 +83,55 @@ class PortfolioAnalyzer:
         Returns:
             Dictionary of risk metrics
         """
-        annual_returns = returns.mean() * 252
-        annual_volatility = returns.std() * np.sqrt(252)
+        r = returns.to_numpy(dtype=np.float64)
+        r = r[~np.isnan(r)]
+        n = len(r)
+
+        mean = r.mean() if n else np.nan
+        std = r.std(ddof=1) if n > 1 else np.nan
+        annual_returns = mean * 252
+        annual_volatility = std * np.sqrt(252)
 
         # Sharpe Ratio
         sharpe_ratio = (annual_returns - risk_free_rate) / annual_volatility
 
         # Maximum Drawdown
-        cumulative = (1 + returns).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
-        max_drawdown = drawdown.min()
-
-        # Value at Risk (VaR) - 95% confidence
-        var_95 = np.percentile(returns, 5)
+        cumulative = np.cumprod(1.0 + r)
+        running_max = np.maximum.accumulate(cumulative)
+        max_drawdown = ((cumulative - running_max) / running_max).min() if n else np.nan
+
+        # Value at Risk (VaR) - 95% confidence: 5th percentile with linear
+        # interpolation, from a partial sort of the two neighbouring order statistics
+        if n:
+            pos = 0.05 * (n - 1)
+            lo = int(pos)
+            hi = min(lo + 1, n - 1)
+            ordered = np.partition(r, (lo, hi))
+            var_95 = ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+        else:
+            var_95 = np.nan
 
         # Conditional VaR (CVaR) - Expected loss beyond VaR
-        cvar_95 = returns[returns <= var_95].mean()
+        tail = r[r <= var_95]
+        cvar_95 = tail.mean() if len(tail) else np.nan
+
+        # Bias-corrected sample skewness and excess kurtosis, as pandas reports them
+        skewness = kurtosis = np.nan
+        if n > 2:
+            dev = r - mean
+            dev2 = dev * dev
+            m2 = dev2.mean()
+            m3 = (dev2 * dev).mean()
+            m4 = (dev2 * dev2).mean()
+            # Like pandas, treat a spread within rounding error of zero as a constant series
+            if m2 < (np.finfo(np.float64).eps * np.abs(r).max()) ** 2:
+                skewness = 0.0
+                kurtosis = 0.0 if n > 3 else np.nan
+            else:
+                skewness = np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5
+                if n > 3:
+                    g2 = m4 / (m2 * m2) - 3.0
+                    kurtosis = ((n + 1) * g2 + 6.0) * (n - 1) / ((n - 2) * (n - 3))
 
         return {
             "annual_return": float(annual_returns),
@@ -88,8 +140,8 @@ class PortfolioAnalyzer:
             "max_drawdown": float(max_drawdown),
             "var_95": float(var_95),
             "cvar_95": float(cvar_95),
-            "skewness": float(returns.skew()),
-            "kurtosis": float(returns.kurtosis()),
+            "skewness": float(skewness),
+            "kurtosis": float(kurtosis),
         }
 
     def analyze_portfolio(
@@ -105,7 +157,8 @@ class PortfolioAnalyzer:
         Returns:
             Complete analysis results
         """
-        returns = self.calculate_returns(prices)
+        asset_returns = self._asset_returns(prices)
+        returns = self._aggregate(asset_returns, prices.index[1:])
         risk_metrics = self.calculate_risk_metrics(returns, risk_free_rate)
 
         return {
@@ -118,5 +171,5 @@ class PortfolioAnalyzer:
                 "daily_std": float(returns.std()),
             },
             "risk_metrics": risk_metrics,
-            "correlation_matrix": prices.pct_change().corr().to_dict(),
+            "correlation_matrix": self._correlation(asset_returns, prices.columns),
         }
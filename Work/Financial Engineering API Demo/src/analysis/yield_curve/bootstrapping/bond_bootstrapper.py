@@ -51,11 +51,11 @@ class BondBootstrapper(Bootstrapper):
 
         return np.array(tenors), np.array(spot_rates)
 
-    def _price_with_rate(
+    def _solve_spot_rate(
         self,
         maturity: float,
         coupon: float,
-        price_rate: float,
+        market_price: float,
         frequency: int,
         face_value: float,
         known_tenors: List[float],
@@ -63,47 +63,39 @@ class BondBootstrapper(Bootstrapper):
     ) -> float:
         comp = self.compounding
         total_periods = int(round(maturity * frequency))
-        coupon_payment = face_value * coupon / frequency
-
-        times = [(i + 1) / frequency for i in range(total_periods)]
-        price = 0.0
-
-        for idx, t in enumerate(times):
-            cf = coupon_payment
-            if idx == total_periods - 1:
-                cf += face_value
-
-            if t < maturity and known_tenors:
-                interp_rate = self.interpolator.interpolate(
-                    np.array(known_tenors), np.array(known_rates), t
-                )
-                df = comp.discount_factor(interp_rate, t)
-            else:
-                df = comp.discount_factor(price_rate, t)
+        times = np.arange(1, total_periods + 1) / frequency
+        cashflows = np.full(total_periods, face_value * coupon / frequency)
+        cashflows[-1] += face_value
+
+        # Cashflows before maturity are discounted off the curve bootstrapped so far;
+        # only the remaining ones depend on the rate being solved for.
+        if known_tenors:
+            known = times < maturity
+        else:
+            known = np.zeros(total_periods, dtype=bool)
+
+        known_pv = 0.0
+        if known.any():
+            interp_rates = self.interpolator.interpolate_many(
+                np.array(known_tenors), np.array(known_rates), times[known]
+            )
+            known_pv = float(np.dot(cashflows[known], comp.discount_factor(interp_rates, times[known])))
 
-            price += cf * df
+        open_times = times[~known]
+        open_cashflows = cashflows[~known]
 
-        return price
+        # Usual case: a single final cashflow, so its discount factor follows directly
+        if len(open_times) == 1:
+            discount_factor = (market_price - known_pv) / open_cashflows[0]
+            if discount_factor <= 0:
+                raise ValueError(f"Bond price {market_price} is below the PV of its earlier cashflows")
+            return float(comp.implied_rate(discount_factor, float(open_times[0])))
 
-    def _solve_spot_rate(
-        self,
-        maturity: float,
-        coupon: float,
-        market_price: float,
-        frequency: int,
-        face_value: float,
-        known_tenors: List[float],
-        known_rates: List[float],
-    ) -> float:
         def objective(r: float) -> float:
-            return self._price_with_rate(
-                maturity, coupon, r, frequency, face_value, known_tenors, known_rates
-            ) - market_price
+            return known_pv + float(np.dot(open_cashflows, comp.discount_factor(r, open_times))) - market_price
 
+        # Check the bracket up front rather than letting brentq raise and retrying
         lower, upper = -0.05, 0.5
-        try:
+        if objective(lower) * objective(upper) < 0:
             return float(brentq(objective, lower, upper, maxiter=100))
-        except ValueError:
-            return float(brentq(objective, -0.1, 1.0, maxiter=200))
-
-
+        return float(brentq(objective, -0.1, 1.0, maxiter=200))
@@ -7,16 +7,22 @@ from .base import Bootstrapper
 
 class BootstrapperRegistry:
     _registry: Dict[str, Type[Bootstrapper]] = {}
+    # These strategies hold no per-call state, so one shared instance per name suffices
+    _instances: Dict[str, Bootstrapper] = {}
 
     @classmethod
     def register(cls, name: str, bootstrapper_class: Type[Bootstrapper]) -> None:
         cls._registry[name] = bootstrapper_class
+        cls._instances.pop(name, None)
 
     @classmethod
     def get(cls, name: str) -> Bootstrapper:
-        if name not in cls._registry:
-            raise ValueError(f"Unknown bootstrapper: {name}")
-        return cls._registry[name]()  # type: ignore[call-arg]
+        instance = cls._instances.get(name)
+        if instance is None:
+            if name not in cls._registry:
+                raise ValueError(f"Unknown bootstrapper: {name}")
+            instance = cls._instances[name] = cls._registry[name]()  # type: ignore[call-arg]
+        return instance
 
     @classmethod
     def list_available(cls) -> List[str]:
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+from scipy.optimize import brentq
+
 
 class Compounding(ABC):
     """Base compounding interface."""
@@ -14,4 +16,8 @@ class Compounding(ABC):
     def forward_rate(self, r1: float, t1: float, r2: float, t2: float) -> float:
         """Calculate forward rate between t1 and t2."""
 
+    def implied_rate(self, discount_factor: float, tenor: float) -> float:
+        """Rate whose discount factor at tenor equals discount_factor."""
+        return float(brentq(lambda r: self.discount_factor(r, tenor) - discount_factor, -0.99 / tenor, 10.0))
+
 
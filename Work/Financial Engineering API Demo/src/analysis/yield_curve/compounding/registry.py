@@ -7,16 +7,22 @@ from .base import Compounding
 
 class CompoundingRegistry:
     _registry: Dict[str, Type[Compounding]] = {}
+    # These strategies hold no per-call state, so one shared instance per name suffices
+    _instances: Dict[str, Compounding] = {}
 
     @classmethod
     def register(cls, name: str, comp_class: Type[Compounding]) -> None:
         cls._registry[name] = comp_class
+        cls._instances.pop(name, None)
 
     @classmethod
     def get(cls, name: str) -> Compounding:
-        if name not in cls._registry:
-            raise ValueError(f"Unknown compounding method: {name}")
-        return cls._registry[name]()  # type: ignore[call-arg]
+        instance = cls._instances.get(name)
+        if instance is None:
+            if name not in cls._registry:
+                raise ValueError(f"Unknown compounding method: {name}")
+            instance = cls._instances[name] = cls._registry[name]()  # type: ignore[call-arg]
+        return instance
 
     @classmethod
     def list_available(cls) -> List[str]:
@@ -7,6 +7,9 @@ class SimpleCompounding(Compounding):
     def discount_factor(self, rate: float, tenor: float) -> float:
         return 1.0 / (1.0 + rate * tenor)
 
+    def implied_rate(self, discount_factor: float, tenor: float) -> float:
+        return (1.0 / discount_factor - 1.0) / tenor
+
     def forward_rate(self, r1: float, t1: float, r2: float, t2: float) -> float:
         df1 = self.discount_factor(r1, t1)
         df2 = self.discount_factor(r2, t2)
@@ -9,6 +9,12 @@ from ..compounding.registry import CompoundingRegistry
 from ..interpolation.base import Interpolator
 from ..day_count.base import DayCount
 from ..compounding.base import Compounding
+from ..compounding.continuous import ContinuousCompounding
+
+
+def _isclose(a: float, b: float) -> bool:
+    """Scalar np.isclose with its default tolerances."""
+    return abs(a - b) <= 1e-08 + 1e-05 * abs(b)
 
 
 class YieldCurve:
@@ -43,6 +49,10 @@ class YieldCurve:
         self.day_count = day_count or DayCountRegistry.get("ACT/365")
         self.compounding = compounding or CompoundingRegistry.get("simple")
         self.curve_type = curve_type
+        # Continuous curves whose interpolator can fuse the rate lookup with exp(-r*t)
+        self._fused_discount = isinstance(self.compounding, ContinuousCompounding) and hasattr(
+            self.interpolator, "continuous_discount_factor"
+        )
 
     def spot_rate(self, tenor: float) -> float:
         """
@@ -62,9 +72,43 @@ class YieldCurve:
         """
         Compute discount factor using the configured compounding method.
         """
+        tenor = float(tenor)
+        if self._fused_discount and self.tenors[0] < tenor < self.tenors[-1]:
+            # Interior point off the pillars: let the interpolator fuse rate lookup and
+            # exp(-r*t). Tenors are sorted, so only the two neighbours can be a pillar.
+            right = int(np.searchsorted(self.tenors, tenor))
+            if not (_isclose(tenor, self.tenors[right - 1]) or _isclose(tenor, self.tenors[right])):
+                return self.interpolator.continuous_discount_factor(self.tenors, self.rates, tenor)
         rate = self.spot_rate(tenor)
         return float(self.compounding.discount_factor(rate, tenor))
 
+    def spot_rates(self, tenors: Sequence[float]) -> np.ndarray:
+        """
+        Vectorized spot_rate for an array of tenors.
+        """
+        targets = np.asarray(tenors, dtype=float)
+        if np.any(targets <= 0):
+            raise ValueError("Tenor must be positive")
+        result = self.interpolator.interpolate_many(self.tenors, self.rates, targets)
+        # Pillar tenors return their quoted rate exactly, as in spot_rate. Tenors are
+        # sorted, so only the two neighbours found by searchsorted can match.
+        last = len(self.tenors) - 1
+        right = np.minimum(np.searchsorted(self.tenors, targets), last)
+        left = np.maximum(right - 1, 0)
+        left_hit = np.isclose(targets, self.tenors[left])
+        right_hit = np.isclose(targets, self.tenors[right]) & ~left_hit
+        result[left_hit] = self.rates[left[left_hit]]
+        result[right_hit] = self.rates[right[right_hit]]
+        return result
+
+    def discount_factors(self, tenors: Sequence[float]) -> np.ndarray:
+        """
+        Vectorized discount_factor for an array of tenors.
+        """
+        targets = np.asarray(tenors, dtype=float)
+        rates = self.spot_rates(targets)
+        return np.asarray(self.compounding.discount_factor(rates, targets), dtype=float)
+
     def forward_rate(self, t1: float, t2: float) -> float:
         """
         Compute forward rate between t1 and t2 using spot rates.
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Sequence
 
 from ..interpolation.registry import InterpolatorRegistry
 from ..day_count.registry import DayCountRegistry
@@ -16,8 +16,8 @@ class CurveFactory:
 
     @staticmethod
     def create_spot_curve(
-        tenors: List[float],
-        rates: List[float],
+        tenors: Sequence[float],
+        rates: Sequence[float],
         interpolation: str = "linear",
         day_count: str = "ACT/365",
         compounding: str = "simple",
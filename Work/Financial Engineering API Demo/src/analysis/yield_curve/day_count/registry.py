@@ -7,16 +7,22 @@ from .base import DayCount
 
 class DayCountRegistry:
     _registry: Dict[str, Type[DayCount]] = {}
+    # These strategies hold no per-call state, so one shared instance per name suffices
+    _instances: Dict[str, DayCount] = {}
 
     @classmethod
     def register(cls, name: str, dc_class: Type[DayCount]) -> None:
         cls._registry[name] = dc_class
+        cls._instances.pop(name, None)
 
     @classmethod
     def get(cls, name: str) -> DayCount:
-        if name not in cls._registry:
-            raise ValueError(f"Unknown day count convention: {name}")
-        return cls._registry[name]()  # type: ignore[call-arg]
+        instance = cls._instances.get(name)
+        if instance is None:
+            if name not in cls._registry:
+                raise ValueError(f"Unknown day count convention: {name}")
+            instance = cls._instances[name] = cls._registry[name]()  # type: ignore[call-arg]
+        return instance
 
     @classmethod
     def list_available(cls) -> List[str]:
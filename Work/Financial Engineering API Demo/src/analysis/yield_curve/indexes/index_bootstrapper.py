@@ -39,14 +39,17 @@ class IndexBootstrapper(Bootstrapper):
         if not market_data:
             raise ValueError("No index data provided for bootstrapping")
 
-        # Validate and normalize index data
-        normalized_data = []
-        for item in market_data:
-            index_code = item.get("index", "").upper()
-            index_def = IndexRegistry.get(index_code)
-            
-            if not index_def:
-                raise ValueError(f"Unknown index: {index_code}. Available: {list(IndexRegistry.list_all().keys())}")
+        # Validate each observation and fill the tenor/rate arrays in one pass
+        n = len(market_data)
+        tenors = np.empty(n, dtype=float)
+        rates = np.empty(n, dtype=float)
+        # A curve uses a handful of indexes over many tenors, so resolve each raw code once
+        resolved_codes: Dict[str, str] = {}
+        for i, item in enumerate(market_data):
+            raw_code = item.get("index", "")
+            index_code = resolved_codes.get(raw_code)
+            if index_code is None:
+                index_code = resolved_codes[raw_code] = self._resolve_index_code(raw_code)
             
             tenor = float(item.get("tenor", item.get("maturity", 0)))
             rate = float(item.get("rate", 0))
@@ -54,25 +57,28 @@ class IndexBootstrapper(Bootstrapper):
             if tenor <= 0:
                 raise ValueError(f"Invalid tenor for index {index_code}: {tenor}")
             
-            normalized_data.append({
-                "index": index_code,
-                "index_def": index_def,
-                "tenor": tenor,
-                "rate": rate,
-            })
-
-        # Sort by tenor
-        normalized_data.sort(key=lambda x: x["tenor"])
-        
-        # Extract tenors and rates
-        tenors = np.array([d["tenor"] for d in normalized_data], dtype=float)
-        rates = np.array([d["rate"] for d in normalized_data], dtype=float)
+            tenors[i] = tenor
+            rates[i] = rate
 
         # For now, treat index rates as spot rates
         # In a full implementation, you'd convert index rates to spot rates
         # using bootstrapping from swaps, FRAs, etc.
         
-        return tenors, rates
+        return self._sort_by_tenor(tenors, rates)
+
+    @staticmethod
+    def _resolve_index_code(raw_code: str) -> str:
+        """Upper-cased index code, or ValueError if it is not registered"""
+        index_code = raw_code.upper()
+        if not IndexRegistry.get(index_code):
+            raise ValueError(f"Unknown index: {index_code}. Available: {list(IndexRegistry.list_all().keys())}")
+        return index_code
+
+    @staticmethod
+    def _sort_by_tenor(tenors: np.ndarray, rates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Sort by tenor; stable, so observations sharing a tenor keep their input order"""
+        order = np.argsort(tenors, kind="stable")
+        return tenors[order], rates[order]
 
     @staticmethod
     def create_from_index_rates(
@@ -91,23 +97,41 @@ class IndexBootstrapper(Bootstrapper):
         Returns:
             Tuple of (tenors, spot_rates)
         """
-        all_data = []
+        primary_upper = primary_index.upper() if primary_index else None
+        
+        # Primary index first if specified; the stable tenor sort keeps it ahead on tenor ties
+        ordered = sorted(
+            index_rates.items(),
+            key=lambda item: 0 if primary_upper and item[0].upper() == primary_upper else 1,
+        )
         
-        # Flatten all index rates into single list
-        for index_code, rates in index_rates.items():
-            for rate_data in rates:
-                rate_data["index"] = index_code
-                all_data.append(rate_data)
+        # Validate and convert one index at a time, then concatenate into a single curve
+        tenor_parts = []
+        rate_parts = []
+        for index_code, observations in ordered:
+            if not observations:
+                continue
+            index_code = IndexBootstrapper._resolve_index_code(index_code)
+            n = len(observations)
+            tenors = np.fromiter(
+                (float(obs.get("tenor", obs.get("maturity", 0))) for obs in observations), dtype=float, count=n
+            )
+            rates = np.fromiter((float(obs.get("rate", 0)) for obs in observations), dtype=float, count=n)
+            invalid = np.flatnonzero(tenors <= 0)
+            if invalid.size:
+                raise ValueError(f"Invalid tenor for index {index_code}: {tenors[invalid[0]]}")
+            tenor_parts.append(tenors)
+            rate_parts.append(rates)
+        
+        if not tenor_parts:
+            raise ValueError("No index data provided for bootstrapping")
         
-        # If primary index specified, prioritize it
-        if primary_index:
-            primary_upper = primary_index.upper()
-            # Sort: primary index first, then others
-            all_data.sort(key=lambda x: (
-                0 if x.get("index", "").upper() == primary_upper else 1,
-                x.get("tenor", x.get("maturity", 0))
-            ))
+        tenors, rates = IndexBootstrapper._sort_by_tenor(np.concatenate(tenor_parts), np.concatenate(rate_parts))
         
-        bootstrapper = IndexBootstrapper()
-        return bootstrapper.bootstrap(all_data)
+        # Where sources overlap keep one node per tenor: the first, i.e. the primary index's
+        # quote. Repeated tenors would also leave the spline with zero-width segments.
+        keep = np.empty(len(tenors), dtype=bool)
+        keep[0] = True
+        np.greater(np.diff(tenors), 1e-9, out=keep[1:])
+        return tenors[keep], rates[keep]
 
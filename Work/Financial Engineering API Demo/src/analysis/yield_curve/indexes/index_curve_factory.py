@@ -7,6 +7,8 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from ..core.curve_factory import CurveFactory
 from ..core.curve import YieldCurve
 from .index_bootstrapper import IndexBootstrapper
@@ -45,14 +47,24 @@ class IndexCurveFactory:
         if not index_def:
             raise ValueError(f"Unknown index: {index_code}")
         
-        # Add index code to each rate observation
-        market_data = [
-            {**rate, "index": index_code}
-            for rate in index_rates
-        ]
+        if not index_rates:
+            raise ValueError("No index data provided for bootstrapping")
+        
+        # Every observation belongs to the index validated above, so read the rows
+        # straight into arrays rather than tagging each one for bootstrap() to re-check
+        count = len(index_rates)
+        tenors = np.fromiter(
+            (float(r.get("tenor", r.get("maturity", 0))) for r in index_rates), dtype=float, count=count
+        )
+        rates = np.fromiter((float(r.get("rate", 0)) for r in index_rates), dtype=float, count=count)
+        if not np.all(tenors > 0):
+            bad = tenors[~(tenors > 0)][0]
+            raise ValueError(f"Invalid tenor for index {index_code.upper()}: {bad}")
         
-        bootstrapper = IndexBootstrapper()
-        tenors, rates = bootstrapper.bootstrap(market_data)
+        # Stable, like the list sort in bootstrap(), so duplicate tenors keep their order
+        order = np.argsort(tenors, kind="stable")
+        tenors = tenors[order]
+        rates = rates[order]
         
         # Use index defaults if not specified
         day_count = day_count or index_def.day_count
@@ -110,8 +122,8 @@ class IndexCurveFactory:
                 compounding = compounding or index_def.compounding
         
         return CurveFactory.create_spot_curve(
-            tenors=tenors.tolist(),
-            rates=rates.tolist(),
+            tenors=tenors,
+            rates=rates,
             interpolation=interpolation,
             day_count=day_count,
             compounding=compounding,
@@ -128,16 +140,8 @@ class IndexCurveFactory:
         Returns:
             Dict mapping index codes to names
         """
-        all_indexes = IndexRegistry.list_all()
-        
         if currency:
-            currency_upper = currency.upper()
-            filtered = {
-                code: index.name
-                for code, index in all_indexes.items()
-                if index.currency.upper() == currency_upper
-            }
-            return filtered
+            return IndexRegistry.names_for_currency(currency)
         
-        return {code: index.name for code, index in all_indexes.items()}
+        return {code: index.name for code, index in IndexRegistry.list_all().items()}
 
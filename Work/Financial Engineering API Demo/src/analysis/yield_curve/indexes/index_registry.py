@@ -3,9 +3,10 @@ Interest Rate Index Registry
 Defines standard market indexes (SOFR, LIBOR, EURIBOR, etc.)
 """
 
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
 
 class IndexType(Enum):
@@ -16,7 +17,7 @@ class IndexType(Enum):
     SWAP = "SWAP"  # Swap-based
 
 
-@dataclass
+@dataclass(frozen=True)
 class InterestRateIndex:
     """
     Represents an interest rate index (e.g., SOFR, LIBOR, EURIBOR)
@@ -41,11 +42,19 @@ class IndexRegistry:
     Similar to Murex's index definitions
     """
     _indexes: Dict[str, InterestRateIndex] = {}
+    # Code -> name per upper-cased currency, kept in step with _indexes by register()
+    _names_by_currency: Dict[str, Dict[str, str]] = {}
 
     @classmethod
     def register(cls, code: str, index: InterestRateIndex) -> None:
         """Register an index"""
-        cls._indexes[code.upper()] = index
+        code = code.upper()
+        currency = index.currency.upper()
+        previous = cls._indexes.get(code)
+        if previous is not None and previous.currency.upper() != currency:
+            cls._names_by_currency[previous.currency.upper()].pop(code, None)
+        cls._indexes[code] = index
+        cls._names_by_currency.setdefault(currency, {})[code] = index.name
 
     @classmethod
     def get(cls, code: str) -> Optional[InterestRateIndex]:
@@ -53,9 +62,14 @@ class IndexRegistry:
         return cls._indexes.get(code.upper())
 
     @classmethod
-    def list_all(cls) -> Dict[str, InterestRateIndex]:
-        """List all registered indexes"""
-        return cls._indexes.copy()
+    def list_all(cls) -> Mapping[str, InterestRateIndex]:
+        """List all registered indexes (a read-only view, not a copy)"""
+        return MappingProxyType(cls._indexes)
+
+    @classmethod
+    def names_for_currency(cls, currency: str) -> Dict[str, str]:
+        """Map of index code to name for one currency"""
+        return dict(cls._names_by_currency.get(currency.upper(), {}))
 
     @classmethod
     def initialize_defaults(cls) -> None:
@@ -15,4 +15,15 @@ class Interpolator(ABC):
     def extrapolate(self, tenors: np.ndarray, rates: np.ndarray, target_tenor: float) -> float:
         """Extrapolate rate beyond known curve."""
 
+    def interpolate_many(self, tenors: np.ndarray, rates: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """Rates for an array of targets, extrapolating outside the known tenors."""
+        return np.array(
+            [
+                self.extrapolate(tenors, rates, t) if t < tenors[0] or t > tenors[-1]
+                else self.interpolate(tenors, rates, t)
+                for t in targets
+            ],
+            dtype=float,
+        )
+
 
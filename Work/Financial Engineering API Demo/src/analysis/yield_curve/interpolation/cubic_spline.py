@@ -1,10 +1,152 @@
 from __future__ import annotations
 
+import math
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Optional, Tuple
+
 import numpy as np
-from scipy.interpolate import CubicSpline
+from scipy.linalg import lu_factor, lu_solve
 
+from ....utils.jit import njit, prange, NUMBA_AVAILABLE
 from .base import Interpolator
 
+# Above this many targets the parallel kernel outweighs its thread start-up cost
+_PARALLEL_EVAL_MIN = 64
+
+
+@njit(cache=True)
+def _eval_cubic(x, knots, a, b, c, d):
+    i = np.searchsorted(knots, x, side="right") - 1
+    if i < 0:
+        i = 0
+    elif i > a.shape[0] - 1:
+        i = a.shape[0] - 1
+    dx = x - knots[i]
+    return a[i] + dx * (b[i] + dx * (c[i] + dx * d[i]))
+
+
+@njit(cache=True)
+def _eval_continuous_df(x, knots, a, b, c, d):
+    # Spline rate and exp(-r*t) in one call, for continuously compounded curves
+    return math.exp(-_eval_cubic(x, knots, a, b, c, d) * x)
+
+
+@njit(cache=True)
+def _eval_cubic_many(xs, knots, a, b, c, d):
+    out = np.empty(xs.shape[0])
+    for j in range(xs.shape[0]):
+        out[j] = _eval_cubic(xs[j], knots, a, b, c, d)
+    return out
+
+
+@njit(cache=True, parallel=True)
+def _eval_cubic_many_parallel(xs, knots, a, b, c, d):
+    out = np.empty(xs.shape[0])
+    for j in prange(xs.shape[0]):
+        out[j] = _eval_cubic(xs[j], knots, a, b, c, d)
+    return out
+
+
+@lru_cache(maxsize=256)
+def _natural_spline_system(tenors_key: Tuple[float, ...]) -> Tuple[np.ndarray, Optional[tuple]]:
+    """
+    Interval widths and LU factors of the natural-spline tridiagonal system.
+
+    The matrix depends only on the tenors, so curves that share a tenor grid
+    reuse the factorization and only back-substitute for new rates.
+    """
+    x = np.array(tenors_key, dtype=float)
+    h = np.diff(x)
+    n_inner = len(x) - 2
+    if n_inner < 1:
+        return h, None
+    matrix = np.zeros((n_inner, n_inner))
+    idx = np.arange(n_inner)
+    matrix[idx, idx] = 2.0 * (h[:-1] + h[1:])
+    matrix[idx[1:], idx[:-1]] = h[1:-1]
+    matrix[idx[:-1], idx[1:]] = h[1:-1]
+    return h, lu_factor(matrix)
+
+
+class _CubicCoefficients:
+    """
+    Piecewise cubic a + b*dx + c*dx**2 + d*dx**3 on [knots[i], knots[i+1]].
+
+    Evaluation is a searchsorted plus Horner's rule; points outside the knots
+    use the first/last polynomial, like scipy's extrapolate=True.
+    """
+
+    def __init__(self, knots: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray):
+        self.knots = knots
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+        # Plain-float copies for the scalar path, which avoids NumPy call overhead
+        self._knot_list = knots.tolist()
+        self._rows = list(zip(a.tolist(), b.tolist(), c.tolist(), d.tolist()))
+
+    def __call__(self, x, nu: int = 0):
+        if NUMBA_AVAILABLE and nu == 0:
+            if np.ndim(x) == 0:
+                return _eval_cubic(float(x), self.knots, self.a, self.b, self.c, self.d)
+            xs = np.asarray(x, dtype=float)
+            kernel = _eval_cubic_many_parallel if xs.size >= _PARALLEL_EVAL_MIN else _eval_cubic_many
+            return kernel(xs.ravel(), self.knots, self.a, self.b, self.c, self.d).reshape(xs.shape)
+        if np.ndim(x) == 0:
+            x = float(x)
+            i = min(max(bisect_right(self._knot_list, x) - 1, 0), len(self._rows) - 1)
+            a, b, c, d = self._rows[i]
+            dx = x - self._knot_list[i]
+            if nu == 1:
+                return b + dx * (2.0 * c + dx * 3.0 * d)
+            return a + dx * (b + dx * (c + dx * d))
+        x = np.asarray(x, dtype=float)
+        idx = np.clip(np.searchsorted(self.knots, x, side="right") - 1, 0, len(self.a) - 1)
+        dx = x - self.knots[idx]
+        if nu == 1:
+            return self.b[idx] + dx * (2.0 * self.c[idx] + dx * 3.0 * self.d[idx])
+        return self.a[idx] + dx * (self.b[idx] + dx * (self.c[idx] + dx * self.d[idx]))
+
+    def continuous_discount_factor(self, x: float) -> float:
+        """exp(-s(x) * x) for the spline value s(x)."""
+        if NUMBA_AVAILABLE:
+            return _eval_continuous_df(x, self.knots, self.a, self.b, self.c, self.d)
+        return math.exp(-self(x) * x)
+
+
+def _natural_cubic_spline(tenors: np.ndarray, rates: np.ndarray) -> _CubicCoefficients:
+    """Natural cubic spline through (tenors, rates), equivalent to CubicSpline(bc_type="natural")."""
+    if len(tenors) < 2:
+        raise ValueError("Cubic spline needs at least two tenors")
+    h, lu = _natural_spline_system(tuple(tenors.tolist()))
+    slopes = np.diff(rates) / h
+    m = np.zeros(len(tenors))
+    if lu is not None:
+        m[1:-1] = lu_solve(lu, 6.0 * np.diff(slopes))
+    return _CubicCoefficients(
+        knots=tenors.copy(),
+        a=rates[:-1].copy(),
+        b=slopes - h * (2.0 * m[:-1] + m[1:]) / 6.0,
+        c=m[:-1] / 2.0,
+        d=np.diff(m) / (6.0 * h),
+    )
+
+
+def warm_kernels() -> None:
+    """
+    Compile (or load from numba's on-disk cache) the evaluation kernels above, so
+    the cost is paid at application startup rather than by the first request
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    spline = _natural_cubic_spline(np.array([1.0, 2.0, 3.0]), np.array([0.01, 0.02, 0.03]))
+    spline(1.5)
+    spline.continuous_discount_factor(1.5)
+    spline(np.array([1.5, 2.5]))
+    spline(np.linspace(1.0, 3.0, _PARALLEL_EVAL_MIN))
+
 
 class CubicSplineInterpolator(Interpolator):
     def __init__(self):
@@ -14,13 +156,18 @@ class CubicSplineInterpolator(Interpolator):
     def _ensure_spline(self, tenors: np.ndarray, rates: np.ndarray):
         cache_key = (tuple(tenors.tolist()), tuple(rates.tolist()))
         if self._spline is None or self._cache_key != cache_key:
-            self._spline = CubicSpline(tenors, rates, bc_type="natural")
+            self._spline = _natural_cubic_spline(tenors, rates)
             self._cache_key = cache_key
 
     def interpolate(self, tenors: np.ndarray, rates: np.ndarray, target_tenor: float) -> float:
         self._ensure_spline(tenors, rates)
         return float(self._spline(target_tenor))
 
+    def continuous_discount_factor(self, tenors: np.ndarray, rates: np.ndarray, target_tenor: float) -> float:
+        """Continuously compounded discount factor at an interior target tenor."""
+        self._ensure_spline(tenors, rates)
+        return float(self._spline.continuous_discount_factor(float(target_tenor)))
+
     def extrapolate(self, tenors: np.ndarray, rates: np.ndarray, target_tenor: float) -> float:
         self._ensure_spline(tenors, rates)
         if target_tenor < tenors[0]:
@@ -29,4 +176,15 @@ class CubicSplineInterpolator(Interpolator):
         slope = self._spline(tenors[-1], 1)
         return float(rates[-1] + slope * (target_tenor - tenors[-1]))
 
+    def interpolate_many(self, tenors: np.ndarray, rates: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        self._ensure_spline(tenors, rates)
+        result = np.asarray(self._spline(targets), dtype=float)
+        below = targets < tenors[0]
+        if below.any():
+            result[below] = rates[0] + self._spline(tenors[1], 1) * (targets[below] - tenors[0])
+        above = targets > tenors[-1]
+        if above.any():
+            result[above] = rates[-1] + self._spline(tenors[-1], 1) * (targets[above] - tenors[-1])
+        return result
+
 
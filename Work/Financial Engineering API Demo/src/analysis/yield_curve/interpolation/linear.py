@@ -14,4 +14,8 @@ class LinearInterpolator(Interpolator):
             return float(rates[0])
         return float(rates[-1])
 
+    def interpolate_many(self, tenors: np.ndarray, rates: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        # np.interp already holds the end rates flat outside the tenor range
+        return np.interp(targets, tenors, rates)
+
 
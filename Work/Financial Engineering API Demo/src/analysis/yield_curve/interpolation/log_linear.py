@@ -10,8 +10,14 @@ class LogLinearInterpolator(Interpolator):
     Log-linear interpolation on rates (guarded against zeros).
     """
 
+    @staticmethod
+    def _log_rates(rates: np.ndarray) -> np.ndarray:
+        # Floor and log in one buffer instead of allocating a temporary per step
+        log_rates = np.maximum(rates, 1e-8)
+        return np.log(log_rates, out=log_rates)
+
     def interpolate(self, tenors: np.ndarray, rates: np.ndarray, target_tenor: float) -> float:
-        log_rates = np.log(np.maximum(rates, 1e-8))
+        log_rates = self._log_rates(rates)
         log_interp = np.interp(target_tenor, tenors, log_rates)
         return float(np.exp(log_interp))
 
@@ -20,4 +26,11 @@ class LogLinearInterpolator(Interpolator):
             return float(rates[0])
         return float(rates[-1])
 
+    def interpolate_many(self, tenors: np.ndarray, rates: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        result = np.interp(targets, tenors, self._log_rates(rates))
+        np.exp(result, out=result)
+        result[targets < tenors[0]] = rates[0]
+        result[targets > tenors[-1]] = rates[-1]
+        return result
+
 
@@ -8,15 +8,17 @@ def ensure_sorted_unique(tenors: Sequence[float], rates: Sequence[float]) -> Tup
     """
     Ensure tenors/rates are sorted by tenor and remove duplicates by keeping first occurrence.
     """
-    tenors_arr = np.array(tenors, dtype=float)
-    rates_arr = np.array(rates, dtype=float)
+    tenors_arr = np.asarray(tenors, dtype=float)
+    rates_arr = np.asarray(rates, dtype=float)
 
-    sort_idx = np.argsort(tenors_arr)
+    # Stable, so the first occurrence of a repeated tenor is the one kept
+    sort_idx = np.argsort(tenors_arr, kind="stable")
     tenors_sorted = tenors_arr[sort_idx]
     rates_sorted = rates_arr[sort_idx]
 
-    unique_tenors, unique_idx = np.unique(tenors_sorted, return_index=True)
-    unique_rates = rates_sorted[unique_idx]
-    return unique_tenors, unique_rates
-
-
+    # Already sorted, so duplicates are adjacent and one comparison pass finds them
+    keep = np.empty(tenors_sorted.shape, dtype=bool)
+    if keep.size:
+        keep[0] = True
+        np.not_equal(tenors_sorted[1:], tenors_sorted[:-1], out=keep[1:])
+    return tenors_sorted[keep], rates_sorted[keep]
@@ -3,7 +3,10 @@ FRED API Client
 Fetches US Treasury yield data from Federal Reserve Economic Data (FRED)
 """
 
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import logging
@@ -29,7 +32,29 @@ TREASURY_SERIES = {
 }
 
 # Cache for 1 hour (Treasury data updates daily)
-_yield_cache = TTLCache(maxsize=10, ttl=3600)
+_yield_cache = TTLCache(maxsize=16, ttl=3600)  # 11 series plus the assembled curve
+
+# Series FRED definitively had no value for (4xx, "." or a malformed value), retried
+# after 5 minutes rather than on every call. Transient failures are not recorded.
+_missing_cache = TTLCache(maxsize=32, ttl=300)
+
+# Shared keep-alive session: the per-series fetches run concurrently, so size the pool
+# to reuse one TLS connection per series instead of a fresh handshake per request.
+# Transient 5xx answers are retried in the adapter; if the last attempt still fails the
+# response comes back as-is and the series is not recorded as missing.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=len(TREASURY_SERIES),
+    pool_maxsize=len(TREASURY_SERIES),
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504], raise_on_status=False),
+))
+
+# (connect, read) timeouts for each FRED request
+REQUEST_TIMEOUT = (3, 5)
+
+
+class _TransientFREDError(Exception):
+    """A fetch failed in a way worth retrying on the next call (5xx, 429 or network error)."""
 
 
 class FREDClient:
@@ -64,7 +89,33 @@ class FREDClient:
         cache_key = f"fred_{series_id}_latest"
         if cache_key in _yield_cache:
             return _yield_cache[cache_key]
+        if cache_key in _missing_cache:
+            return None
+
+        try:
+            rate = self._request_series_latest(series_id)
+        except _TransientFREDError:
+            return None
+        if rate is None:
+            _missing_cache[cache_key] = True
+        else:
+            _yield_cache[cache_key] = rate
+        return rate
+
+    def _request_series_latest(self, series_id: str) -> Optional[float]:
+        """
+        Request the latest observation for a FRED series, bypassing the caches
+
+        Args:
+            series_id: FRED series ID (e.g., 'DGS10')
+
+        Returns:
+            Latest rate value or None if FRED has no usable value
 
+        Raises:
+            _TransientFREDError: On a 5xx or 429 response, a network error or an
+                unexpected failure, none of which say the series is missing
+        """
         try:
             # FRED API v2 format - according to official docs at https://fred.stlouisfed.org/docs/api/fred/
             params = {
@@ -75,7 +126,7 @@ class FREDClient:
                 "sort_order": "desc",  # Most recent first
             }
 
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
+            response = _session.get(self.BASE_URL, params=params, timeout=REQUEST_TIMEOUT)
             
             # Check for API errors first
             if response.status_code != 200:
@@ -88,6 +139,8 @@ class FREDClient:
                         logger.error(f"FRED API error message: {error_json['error_message']}")
                 except:
                     pass
+                if response.status_code >= 500 or response.status_code == 429:
+                    raise _TransientFREDError(response.status_code)
                 return None
             
             data = response.json()
@@ -98,9 +151,7 @@ class FREDClient:
                 value_str = obs.get("value", ".")
                 if value_str != "." and value_str is not None:  # FRED uses "." for missing data
                     try:
-                        rate = float(value_str) / 100.0  # Convert percentage to decimal
-                        _yield_cache[cache_key] = rate
-                        return rate
+                        return float(value_str) / 100.0  # Convert percentage to decimal
                     except (ValueError, TypeError):
                         logger.warning(f"Invalid value format for {series_id}: {value_str}")
                         return None
@@ -108,12 +159,14 @@ class FREDClient:
             logger.warning(f"No valid data for series {series_id}")
             return None
 
+        except _TransientFREDError:
+            raise
         except requests.exceptions.RequestException as e:
             logger.error(f"Network error fetching FRED series {series_id}: {e}")
-            return None
+            raise _TransientFREDError(str(e)) from e
         except Exception as e:
             logger.error(f"Error fetching FRED series {series_id}: {e}", exc_info=True)
-            return None
+            raise _TransientFREDError(str(e)) from e
 
     def fetch_treasury_yields(self) -> Tuple[List[float], List[float]]:
         """
@@ -133,12 +186,11 @@ class FREDClient:
             return _yield_cache[cache_key]
 
         # Fetch all series in parallel for speed
-        tenors = []
-        rates = []
         series_list = list(TREASURY_SERIES.keys())
 
-        # Use ThreadPoolExecutor for parallel requests (much faster!)
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        # Use ThreadPoolExecutor for parallel requests, one worker per series so all are
+        # in flight at once (the session's connection pool is sized to match)
+        with ThreadPoolExecutor(max_workers=len(series_list)) as executor:
             future_to_series = {
                 executor.submit(self._fetch_series_latest, series_id): series_id
                 for series_id in series_list
@@ -154,19 +206,62 @@ class FREDClient:
                 except Exception as e:
                     logger.error(f"Error fetching {series_id}: {e}")
 
+        return self._build_yield_result(results)
+
+    async def afetch_treasury_yields(self) -> Tuple[List[float], List[float]]:
+        """
+        Async variant of fetch_treasury_yields that gathers all series concurrently
+        without blocking the event loop
+
+        Returns:
+            Tuple of (tenors, rates) as in fetch_treasury_yields
+        """
+        if not self.api_key:
+            raise ValueError("FRED API key required. Get a free key from https://fred.stlouisfed.org/docs/api/api_key.html")
+
+        cache_key = "treasury_yields_full"
+        if cache_key in _yield_cache:
+            return _yield_cache[cache_key]
+
+        series_list = list(TREASURY_SERIES.keys())
+        rates = await asyncio.gather(
+            *(asyncio.to_thread(self._fetch_series_latest, series_id) for series_id in series_list),
+            return_exceptions=True,
+        )
+
+        results = {}
+        for series_id, rate in zip(series_list, rates):
+            if isinstance(rate, Exception):
+                logger.error(f"Error fetching {series_id}: {rate}")
+            elif rate is not None:
+                results[series_id] = rate
+
+        return self._build_yield_result(results)
+
+    def _build_yield_result(self, results: Dict[str, float]) -> Tuple[List[float], List[float]]:
+        """
+        Order fetched series by tenor and cache the (tenors, rates) result
+
+        Args:
+            results: Mapping of series_id to latest rate
+
+        Returns:
+            Tuple of (tenors, rates)
+        """
+        tenors = []
+        rates = []
         # Build sorted list of tenors and rates
-        for series_id in sorted(series_list, key=lambda x: TREASURY_SERIES[x][0]):
-            if series_id in results:
-                tenor, _ = TREASURY_SERIES[series_id]
-                tenors.append(tenor)
-                rates.append(results[series_id])
+        for series_id in sorted(results, key=lambda x: TREASURY_SERIES[x][0]):
+            tenor, _ = TREASURY_SERIES[series_id]
+            tenors.append(tenor)
+            rates.append(results[series_id])
 
         if not tenors:
             raise ValueError("No Treasury yield data available from FRED")
 
         # Cache the result
         result = (tenors, rates)
-        _yield_cache[cache_key] = result
+        _yield_cache["treasury_yields_full"] = result
         return result
 
     def get_yield_curve_data(self) -> Dict:
@@ -177,6 +272,20 @@ class FREDClient:
             Dictionary with tenors, rates, and metadata
         """
         tenors, rates = self.fetch_treasury_yields()
+        return self._format_yield_curve_data(tenors, rates)
+
+    async def aget_yield_curve_data(self) -> Dict:
+        """
+        Async variant of get_yield_curve_data for use inside the event loop
+
+        Returns:
+            Dictionary with tenors, rates, and metadata
+        """
+        tenors, rates = await self.afetch_treasury_yields()
+        return self._format_yield_curve_data(tenors, rates)
+
+    @staticmethod
+    def _format_yield_curve_data(tenors: List[float], rates: List[float]) -> Dict:
         return {
             "tenors": tenors,
             "rates": [r * 100 for r in rates],  # Convert to percentage for display
@@ -5,6 +5,7 @@ Backtests trading strategies on historical data
 
 import logging
 from typing import Dict, Any, Optional, List
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -74,8 +75,14 @@ class BacktestEngine:
         aligned_prices = price_series.reindex(signals.index, method='ffill')
         aligned_signals = signals.fillna(0)
         
-        # Calculate returns
-        price_returns = aligned_prices.pct_change().fillna(0)
+        # Calculate returns in one pass over the price array (first bar and gaps are 0)
+        prices = aligned_prices.to_numpy(dtype=np.float64)
+        returns = np.zeros_like(prices)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.subtract(prices[1:], prices[:-1], out=returns[1:])
+            np.divide(returns[1:], prices[:-1], out=returns[1:])
+        returns[np.isnan(returns)] = 0.0
+        price_returns = pd.Series(returns, index=aligned_prices.index)
         
         # Calculate position returns (only when signal is 1)
         position_returns = price_returns * aligned_signals
@@ -4,7 +4,7 @@ Scans markets for trading opportunities
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import pandas as pd
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -242,45 +242,16 @@ class MarketScanner:
             logger.error(f"Error scanning {symbol}: {e}", exc_info=True)
             return None
     
-    def scan_stocks(
-        self,
-        symbols: List[str],
-        min_confidence: float = 0.5,
-        asset_type: str = "stock",
-        period: str = "6mo",
-        strategy: Optional[str] = None,
-        full_analysis: bool = True,
-        historical_years: float = 1.0
-    ) -> List[Dict[str, Any]]:
+    def _fetch_prices(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
         """
-        Scan stocks for trading opportunities using parallel processing and batch fetching
+        Batch fetch quotes for symbols, falling back to individual quotes per failed batch
         
         Args:
-            symbols: List of symbols to scan
-            min_confidence: Minimum confidence threshold
-            asset_type: Asset type (stock, crypto, forex, commodities)
-            period: Time period for analysis
-            full_analysis: Whether to run the heavyweight DetailedAnalyzer path
-            historical_years: Years of history to fetch for analysis
+            symbols: List of symbols to quote
             
         Returns:
-            List of opportunity dictionaries with real prices and analysis
+            Dictionary mapping symbol to quote data
         """
-        if not symbols:
-            return []
-        
-        start_time = time.time()
-        opportunities = []
-        
-        # Convert string asset_type to AssetType enum
-        try:
-            asset_type_enum = AssetType(asset_type) if isinstance(asset_type, str) else asset_type
-        except (ValueError, TypeError):
-            # Default to STOCK if conversion fails
-            logger.warning(f"Invalid asset_type '{asset_type}', defaulting to STOCK")
-            asset_type_enum = AssetType.STOCK
-        
-        # Step 1: Batch fetch prices for all symbols
         logger.info(f"Batch fetching prices for {len(symbols)} symbols...")
         price_start = time.time()
         price_data = {}
@@ -308,11 +279,36 @@ class MarketScanner:
         except Exception as e:
             logger.error(f"Error in batch price fetching: {e}, falling back to sequential")
             price_data = {}
+        return price_data
+    
+    def _fetch_group_history(
+        self,
+        symbols: List[str],
+        asset_type: str,
+        historical_years: float
+    ) -> Tuple[AssetType, Dict[str, Optional[pd.DataFrame]]]:
+        """
+        Resolve the asset type and batch fetch historical data for one group of symbols
         
-        # Step 2: Batch fetch historical data for all symbols
-        logger.info(f"Batch fetching historical data for {len(symbols)} symbols...")
+        Args:
+            symbols: Symbols in the group
+            asset_type: Asset type (stock, crypto, forex, commodities)
+            historical_years: Years of history to fetch for analysis
+            
+        Returns:
+            (AssetType enum, dictionary mapping symbol to historical data); the
+            dictionary is empty if the batch fetch failed, so symbols fetch individually
+        """
+        # Convert string asset_type to AssetType enum
+        try:
+            asset_type_enum = AssetType(asset_type) if isinstance(asset_type, str) else asset_type
+        except (ValueError, TypeError):
+            # Default to STOCK if conversion fails
+            logger.warning(f"Invalid asset_type '{asset_type}', defaulting to STOCK")
+            asset_type_enum = AssetType.STOCK
+        
+        logger.info(f"Batch fetching historical data for {len(symbols)} {asset_type} symbols...")
         hist_start = time.time()
-        historical_data_map = {}
         try:
             historical_data_map = self.historical_fetcher.fetch_historical_data_batch(
                 symbols, asset_type_enum, years=historical_years, use_cache=True
@@ -321,56 +317,184 @@ class MarketScanner:
             valid_data_count = sum(1 for v in historical_data_map.values() if v is not None and len(v) >= 50)
             logger.info(f"Historical data fetching completed in {hist_elapsed:.2f}s ({valid_data_count}/{len(symbols)} with sufficient data)")
         except Exception as hist_batch_error:
-            logger.warning(f"Batch historical data fetch failed: {hist_batch_error}, will fetch individually")
+            logger.warning(f"Batch historical data fetch failed for {asset_type}: {hist_batch_error}, will fetch individually")
             historical_data_map = {}
+        return asset_type_enum, historical_data_map
+    
+    def _process_groups(
+        self,
+        groups: List[Tuple[List[str], str, AssetType, float, Dict[str, Optional[pd.DataFrame]]]],
+        price_data: Dict[str, Dict[str, Any]],
+        min_confidence: float,
+        full_analysis: bool,
+        start_time: float
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run _process_symbol for every symbol of every group on one worker pool
         
-        # Step 3: Process symbols in parallel with ThreadPoolExecutor
-        logger.info(f"Processing {len(symbols)} symbols with {self.max_workers} workers...")
+        Args:
+            groups: (symbols, asset_type, asset_type_enum, historical_years,
+                historical_data_map) per group
+            price_data: Pre-fetched quotes keyed by symbol
+            min_confidence: Minimum confidence threshold
+            full_analysis: Whether to run the heavyweight DetailedAnalyzer path
+            start_time: Scan start, for progress logging
+            
+        Returns:
+            One list of opportunities per group, in the order of groups
+        """
+        results: List[List[Dict[str, Any]]] = [[] for _ in groups]
+        total = sum(len(symbols) for symbols, _, _, _, _ in groups)
+        logger.info(f"Processing {total} symbols with {self.max_workers} workers...")
         processed_count = 0
+        found = 0
         
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Submit all symbol processing tasks with pre-fetched data
-            futures = {
-                executor.submit(
-                    self._process_symbol,
-                    symbol,
-                    asset_type_enum,
-                    min_confidence,
-                    asset_type,
-                    price_data.get(symbol, {}).get("price") if price_data.get(symbol) else None,
-                    historical_data_map.get(symbol),
-                    full_analysis,
-                    historical_years
-                ): symbol
-                for symbol in symbols
-            }
+            futures = {}
+            for index, (symbols, asset_type, asset_type_enum, years, historical_data_map) in enumerate(groups):
+                for symbol in symbols:
+                    quote = price_data.get(symbol)
+                    future = executor.submit(
+                        self._process_symbol,
+                        symbol,
+                        asset_type_enum,
+                        min_confidence,
+                        asset_type,
+                        quote.get("price") if quote else None,
+                        historical_data_map.get(symbol),
+                        full_analysis,
+                        years
+                    )
+                    futures[future] = (index, symbol)
             
             # Collect results as they complete
             for future in as_completed(futures):
-                symbol = futures[future]
+                index, symbol = futures[future]
                 try:
                     result = future.result(timeout=60)  # 60 second timeout per symbol (analysis can take time)
                     if result:
-                        opportunities.append(result)
+                        results[index].append(result)
+                        found += 1
                     processed_count += 1
                     
                     # Progress logging for large batches
-                    if processed_count % max(1, len(symbols) // 10) == 0 or processed_count == len(symbols):
-                        progress_pct = (processed_count / len(symbols)) * 100
+                    if processed_count % max(1, total // 10) == 0 or processed_count == total:
+                        progress_pct = (processed_count / total) * 100
                         elapsed = time.time() - start_time
                         rate = processed_count / elapsed if elapsed > 0 else 0
-                        eta = (len(symbols) - processed_count) / rate if rate > 0 else 0
-                        logger.info(f"Progress: {processed_count}/{len(symbols)} ({progress_pct:.1f}%) | "
-                                  f"Found: {len(opportunities)} opportunities | "
+                        eta = (total - processed_count) / rate if rate > 0 else 0
+                        logger.info(f"Progress: {processed_count}/{total} ({progress_pct:.1f}%) | "
+                                  f"Found: {found} opportunities | "
                                   f"Rate: {rate:.1f} symbols/s | ETA: {eta:.1f}s")
                 except Exception as e:
                     logger.error(f"Error processing {symbol}: {e}", exc_info=True)
                     processed_count += 1
         
+        return results
+    
+    def scan_stocks(
+        self,
+        symbols: List[str],
+        min_confidence: float = 0.5,
+        asset_type: str = "stock",
+        period: str = "6mo",
+        strategy: Optional[str] = None,
+        full_analysis: bool = True,
+        historical_years: float = 1.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Scan stocks for trading opportunities using parallel processing and batch fetching
+        
+        Args:
+            symbols: List of symbols to scan
+            min_confidence: Minimum confidence threshold
+            asset_type: Asset type (stock, crypto, forex, commodities)
+            period: Time period for analysis
+            full_analysis: Whether to run the heavyweight DetailedAnalyzer path
+            historical_years: Years of history to fetch for analysis
+            
+        Returns:
+            List of opportunity dictionaries with real prices and analysis
+        """
+        if not symbols:
+            return []
+        
+        start_time = time.time()
+        
+        # Step 1: Batch fetch prices for all symbols
+        price_data = self._fetch_prices(symbols)
+        
+        # Step 2: Batch fetch historical data for all symbols
+        asset_type_enum, historical_data_map = self._fetch_group_history(symbols, asset_type, historical_years)
+        
+        # Step 3: Process symbols in parallel with ThreadPoolExecutor
+        opportunities = self._process_groups(
+            [(symbols, asset_type, asset_type_enum, historical_years, historical_data_map)],
+            price_data, min_confidence, full_analysis, start_time
+        )[0]
+        
         elapsed_time = time.time() - start_time
         logger.info(f"Scanned {len(symbols)} symbols in {elapsed_time:.2f}s, found {len(opportunities)} opportunities ({elapsed_time/len(symbols):.3f}s per symbol)")
         return opportunities
     
+    def scan_stocks_batched(
+        self,
+        groups: List[Tuple[List[str], str, float]],
+        min_confidence: float = 0.5,
+        full_analysis: bool = True
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Scan several asset-type groups in one pass
+        
+        Quotes for every group are fetched in shared batches, the per-group
+        historical batches run concurrently, and all symbols are processed by a
+        single worker pool instead of one pool per group.
+        
+        Args:
+            groups: List of (symbols, asset_type, historical_years) tuples
+            min_confidence: Minimum confidence threshold
+            full_analysis: Whether to run the heavyweight DetailedAnalyzer path
+            
+        Returns:
+            Dictionary mapping asset type to its list of opportunities; asset
+            types whose group failed are logged and left out, so the other
+            groups' results are still returned
+        """
+        groups = [(symbols, asset_type, years) for symbols, asset_type, years in groups if symbols]
+        if not groups:
+            return {}
+        
+        start_time = time.time()
+        all_symbols = [symbol for symbols, _, _ in groups for symbol in symbols]
+        price_data = self._fetch_prices(all_symbols)
+        
+        # Historical batches are keyed by (asset type, years), so fetch each group concurrently
+        prepared = []
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            hist_futures = [
+                (executor.submit(self._fetch_group_history, symbols, asset_type, years), (symbols, asset_type, years))
+                for symbols, asset_type, years in groups
+            ]
+            for future, (symbols, asset_type, years) in hist_futures:
+                try:
+                    asset_type_enum, historical_data_map = future.result()
+                except Exception as e:
+                    logger.error(f"Error scanning {asset_type} symbols: {e}", exc_info=True)
+                    continue
+                prepared.append((symbols, asset_type, asset_type_enum, years, historical_data_map))
+        
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        if prepared:
+            opportunities = self._process_groups(prepared, price_data, min_confidence, full_analysis, start_time)
+            for (_, asset_type, _, _, _), opps in zip(prepared, opportunities):
+                results.setdefault(asset_type, []).extend(opps)
+        
+        elapsed_time = time.time() - start_time
+        found = sum(len(opps) for opps in results.values())
+        logger.info(f"Scanned {len(all_symbols)} symbols across {len(groups)} asset types in {elapsed_time:.2f}s, found {found} opportunities")
+        return results
+    
     def scan_by_sectors(
         self,
         sectors: List[Sector],
@@ -0,0 +1,29 @@
+"""
+JIT Helpers
+Optional Numba acceleration with pure-Python fallbacks
+"""
+
+try:
+    from numba import get_num_threads, njit, prange
+    NUMBA_AVAILABLE = True
+    # Start the parallel backend's worker pool on the importing (main) thread: with the
+    # TBB layer, a pool first started from a worker thread, such as the startup warm-up
+    # or a threadpool endpoint, hangs interpreter exit
+    get_num_threads()
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable with or without arguments."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+    prange = range
+
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
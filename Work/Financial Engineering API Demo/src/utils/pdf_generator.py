@@ -6,7 +6,7 @@ Generates PDF reports from analysis data
 import os
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -78,19 +78,21 @@ class PDFGenerator:
             spaceAfter=6
         ))
     
-    def generate_report(self, symbol: str, analysis: Dict[str, Any]) -> str:
+    def generate_report(self, symbol: str, analysis: Dict[str, Any], filename: Optional[str] = None) -> str:
         """
         Generate PDF report for a symbol
         
         Args:
             symbol: Stock symbol
             analysis: Analysis data dictionary
+            filename: Optional file name inside output_dir (defaults to a timestamped name)
             
         Returns:
             Path to generated PDF file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{symbol}_analysis_report_{timestamp}.pdf"
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"{symbol}_analysis_report_{timestamp}.pdf"
         filepath = self.output_dir / filename
         
         # Create PDF document
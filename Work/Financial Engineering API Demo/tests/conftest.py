@@ -0,0 +1,14 @@
+"""
+Shared test setup: run from the app directory so api_service's relative paths
+(static/, templates/, output/) resolve, and make `src` importable.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+
+os.chdir(APP_DIR)
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
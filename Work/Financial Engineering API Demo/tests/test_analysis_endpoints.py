@@ -0,0 +1,113 @@
+"""
+Tests for /api/analysis and /api/report with stubbed market data.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import api_service
+
+
+def _daily_history(bars: int = 120) -> pd.DataFrame:
+    close = 100.0 + np.sin(np.arange(bars) / 5.0) + np.arange(bars) * 0.1
+    return pd.DataFrame(
+        {"open": close, "high": close + 1.0, "low": close - 1.0, "close": close, "volume": 1_000_000.0},
+        index=pd.date_range("2024-01-01", periods=bars, freq="D"),
+    )
+
+
+@pytest.fixture
+def market(monkeypatch):
+    """Stub the history and quote sources; yields the list of quoted symbols."""
+    quoted = []
+
+    def get_quote(symbol):
+        quoted.append(symbol)
+        return {"price": 123.45}
+
+    monkeypatch.setattr(
+        api_service.shared_historical_fetcher, "fetch_historical_data",
+        lambda symbol, asset_type, years=1, use_cache=True: _daily_history(),
+    )
+    monkeypatch.setattr(api_service.shared_yahoo_client, "get_quote", get_quote)
+    monkeypatch.setattr(api_service, "analysis_cache", api_service.LRUCache(maxsize=16))
+    return quoted
+
+
+def test_analysis_uses_the_real_time_quote(market):
+    response = TestClient(api_service.app).get("/api/analysis/AAPL")
+
+    assert response.status_code == 200
+    assert response.json()["current_price"] == 123.45
+    assert market == ["AAPL"]
+
+
+class FakePDFGenerator:
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.prices = []
+
+    def generate_report(self, symbol, analysis, filename=None):
+        self.prices.append(analysis["current_price"])
+        path = self.output_dir / filename
+        path.write_bytes(b"%PDF-1.4\n")
+        return str(path)
+
+
+@pytest.fixture
+def pdf_gen(tmp_path, monkeypatch):
+    generator = FakePDFGenerator(tmp_path)
+    monkeypatch.setattr(api_service, "_get_pdf_generator", lambda: generator)
+    monkeypatch.setattr(api_service, "report_cache", api_service.TTLCache(maxsize=16, ttl=900))
+    return generator
+
+
+def test_report_fetches_the_quote_alongside_the_history(market, pdf_gen, monkeypatch):
+    quote_started = threading.Event()
+    get_quote = api_service.shared_yahoo_client.get_quote
+
+    def quote_then_signal(symbol):
+        quote_started.set()
+        return get_quote(symbol)
+
+    def history_after_quote(symbol, asset_type, years=1, use_cache=True):
+        # Only returns promptly if the quote request is already in flight
+        assert quote_started.wait(5)
+        return _daily_history()
+
+    monkeypatch.setattr(api_service.shared_yahoo_client, "get_quote", quote_then_signal)
+    monkeypatch.setattr(api_service.shared_historical_fetcher, "fetch_historical_data", history_after_quote)
+
+    response = TestClient(api_service.app).get("/api/report/aapl")
+
+    assert response.status_code == 200
+    assert pdf_gen.prices == [123.45]
+
+
+def test_cached_report_skips_the_quote(market, pdf_gen):
+    client = TestClient(api_service.app)
+    assert client.get("/api/report/AAPL").status_code == 200
+    assert market == ["AAPL"]
+
+    # Served from the in-memory cache before any fetch is started
+    assert client.get("/api/report/aapl").status_code == 200
+    assert market == ["AAPL"]
+
+    # Served from disk: the early quote is abandoned, not awaited
+    api_service.report_cache.clear()
+    assert client.get("/api/report/AAPL").status_code == 200
+    assert pdf_gen.prices == [123.45]
+    assert len(list(pdf_gen.output_dir.glob("AAPL_analysis_report_*.pdf"))) == 1
+
+
+def test_report_falls_back_to_the_close_when_the_quote_fails(market, pdf_gen, monkeypatch):
+    def failing_quote(symbol):
+        raise RuntimeError("quote feed down")
+
+    monkeypatch.setattr(api_service.shared_yahoo_client, "get_quote", failing_quote)
+
+    assert TestClient(api_service.app).get("/api/report/AAPL").status_code == 200
+    assert pdf_gen.prices == [pytest.approx(float(_daily_history()["close"].iloc[-1]))]
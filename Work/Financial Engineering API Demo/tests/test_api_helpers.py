@@ -0,0 +1,32 @@
+"""
+Tests for the response helpers in api_service
+"""
+
+import numpy as np
+import pandas as pd
+
+import api_service
+
+
+def _baseline_series_to_dict(series: pd.Series) -> dict:
+    """The original per-element implementation the vectorized helper must match."""
+    if series is None or len(series) == 0:
+        return {}
+    return {str(k): (None if pd.isna(v) else float(v)) for k, v in series.items()}
+
+
+def test_series_to_dict_matches_baseline_on_daily_index_with_nans():
+    index = pd.date_range("2024-01-01", periods=6, freq="D")
+    series = pd.Series([1.5, np.nan, 3.0, np.nan, 5.25, 6.0], index=index)
+
+    result = api_service.series_to_dict(series)
+
+    assert result == _baseline_series_to_dict(series)
+    assert list(result) == [str(ts) for ts in index]
+    assert "2024-01-01 00:00:00" in result
+    assert result["2024-01-02 00:00:00"] is None
+
+
+def test_series_to_dict_handles_empty_and_none():
+    assert api_service.series_to_dict(None) == {}
+    assert api_service.series_to_dict(pd.Series([], dtype=float)) == {}
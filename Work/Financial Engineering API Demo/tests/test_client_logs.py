@@ -0,0 +1,69 @@
+"""
+Tests for the client-side debug log storage under logs/.
+"""
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import api_service
+
+
+@pytest.fixture
+def logs_dir(tmp_path, monkeypatch):
+    """Run with a scratch working directory so logs/ is created under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "logs"
+    path.mkdir()
+    return path
+
+
+def _read_lines(path):
+    return [orjson.loads(line) for line in path.read_bytes().splitlines()]
+
+
+def test_legacy_json_array_log_becomes_jsonl(logs_dir):
+    legacy = logs_dir / "modal_debug_2024-01-02.json"
+    legacy.write_bytes(orjson.dumps([{"n": 1}, {"n": 2}]))
+    # Entries appended after the switch but before the migration ran
+    (logs_dir / "modal_debug_2024-01-02.jsonl").write_bytes(b'{"n":3}\n')
+
+    api_service._migrate_legacy_logs(logs_dir)
+
+    assert not legacy.exists()
+    assert _read_lines(logs_dir / "modal_debug_2024-01-02.jsonl") == [{"n": 1}, {"n": 2}, {"n": 3}]
+    # No temp files left behind
+    assert sorted(p.name for p in logs_dir.iterdir()) == ["modal_debug_2024-01-02.jsonl"]
+
+
+def test_unreadable_legacy_log_keeps_existing_lines(logs_dir):
+    legacy = logs_dir / "modal_debug_2024-01-03.json"
+    legacy.write_bytes(b"[{truncated")
+    (logs_dir / "modal_debug_2024-01-03.jsonl").write_bytes(b'{"n":1}\n')
+
+    api_service._migrate_legacy_logs(logs_dir)
+
+    assert not legacy.exists()
+    assert _read_lines(logs_dir / "modal_debug_2024-01-03.jsonl") == [{"n": 1}]
+
+
+def test_append_json_lines_appends_one_entry_per_line(logs_dir):
+    path = logs_dir / "modal_debug_2024-01-04.jsonl"
+
+    api_service._append_json_lines(path, [{"n": 1}, {"msg": "two\nlines"}])
+    api_service._append_json_lines(path, [{"n": 3}])
+
+    assert path.read_bytes().count(b"\n") == 3
+    assert _read_lines(path) == [{"n": 1}, {"msg": "two\nlines"}, {"n": 3}]
+
+
+def test_posted_logs_are_returned_by_latest(logs_dir):
+    client = TestClient(api_service.app)
+
+    for batch in ([{"n": i} for i in range(60)], [{"n": i} for i in range(60, 120)]):
+        assert client.post("/api/logs", json={"logs": batch}).json()["status"] == "ok"
+    body = client.get("/api/logs/latest").json()
+
+    assert body["status"] == "ok"
+    assert body["entry_count"] == 120
+    # Only the last 100 entries are returned, oldest first
+    assert body["logs"] == [{"n": i} for i in range(20, 120)]
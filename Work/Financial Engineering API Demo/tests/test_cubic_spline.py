@@ -0,0 +1,82 @@
+"""
+Regression tests for the natural cubic spline interpolator against the
+scipy PPoly construction it replaced.
+"""
+import numpy as np
+import pytest
+from scipy.interpolate import PPoly
+
+from src.analysis.yield_curve.interpolation import cubic_spline
+from src.analysis.yield_curve.interpolation.cubic_spline import CubicSplineInterpolator
+
+TENORS = np.array([0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.0, 10.0, 20.0, 30.0])
+RATES = np.array([0.0525, 0.0531, 0.0508, 0.0469, 0.0447, 0.0431, 0.0428, 0.0425, 0.0451, 0.0443])
+
+
+def _baseline_spline(tenors: np.ndarray, rates: np.ndarray) -> PPoly:
+    """The previous implementation: a dense natural-spline solve wrapped in PPoly."""
+    h = np.diff(tenors)
+    slopes = np.diff(rates) / h
+    n_inner = len(tenors) - 2
+    matrix = np.zeros((n_inner, n_inner))
+    idx = np.arange(n_inner)
+    matrix[idx, idx] = 2.0 * (h[:-1] + h[1:])
+    matrix[idx[1:], idx[:-1]] = h[1:-1]
+    matrix[idx[:-1], idx[1:]] = h[1:-1]
+    m = np.zeros(len(tenors))
+    m[1:-1] = np.linalg.solve(matrix, 6.0 * np.diff(slopes))
+    coeffs = np.vstack([
+        np.diff(m) / (6.0 * h),
+        m[:-1] / 2.0,
+        slopes - h * (2.0 * m[:-1] + m[1:]) / 6.0,
+        rates[:-1],
+    ])
+    return PPoly(coeffs, tenors)
+
+
+def _baseline_extrapolate(spline: PPoly, target: float) -> float:
+    if target < TENORS[0]:
+        return float(RATES[0] + spline(TENORS[1], 1) * (target - TENORS[0]))
+    return float(RATES[-1] + spline(TENORS[-1], 1) * (target - TENORS[-1]))
+
+
+@pytest.fixture(params=[True, False], ids=["jit", "python"])
+def interpolator(request, monkeypatch):
+    if request.param and not cubic_spline.NUMBA_AVAILABLE:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(cubic_spline, "NUMBA_AVAILABLE", request.param)
+    return CubicSplineInterpolator()
+
+
+def test_interpolation_matches_baseline(interpolator):
+    baseline = _baseline_spline(TENORS, RATES)
+    # Enough targets to take the parallel kernel as well as the scalar path
+    targets = np.linspace(TENORS[0], TENORS[-1], 257)
+
+    np.testing.assert_allclose(
+        interpolator.interpolate_many(TENORS, RATES, targets), baseline(targets), rtol=0, atol=1e-12
+    )
+    for target in targets[::16]:
+        assert interpolator.interpolate(TENORS, RATES, target) == pytest.approx(float(baseline(target)), abs=1e-12)
+
+
+def test_knots_are_hit_exactly(interpolator):
+    np.testing.assert_allclose(interpolator.interpolate_many(TENORS, RATES, TENORS), RATES, rtol=0, atol=1e-12)
+    for tenor, rate in zip(TENORS, RATES):
+        assert interpolator.interpolate(TENORS, RATES, tenor) == pytest.approx(rate, abs=1e-12)
+
+
+@pytest.mark.parametrize("target", [0.0, 0.1, 35.0, 50.0])
+def test_extrapolation_matches_baseline_at_both_ends(interpolator, target):
+    expected = _baseline_extrapolate(_baseline_spline(TENORS, RATES), target)
+
+    assert interpolator.extrapolate(TENORS, RATES, target) == pytest.approx(expected, abs=1e-12)
+    many = interpolator.interpolate_many(TENORS, RATES, np.array([target]))
+    assert many[0] == pytest.approx(expected, abs=1e-12)
+
+
+def test_continuous_discount_factor_matches_baseline(interpolator):
+    baseline = _baseline_spline(TENORS, RATES)
+    for target in (0.75, 4.0, 12.5):
+        expected = np.exp(-float(baseline(target)) * target)
+        assert interpolator.continuous_discount_factor(TENORS, RATES, target) == pytest.approx(expected, abs=1e-12)
@@ -0,0 +1,106 @@
+"""
+Tests for the DetailedAnalyzer numeric kernels.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.detailed_analyzer import DetailedAnalyzer, _batch_price_stats, _price_stats, _rsi_wilder
+
+
+def test_rsi_wilder_matches_hand_computed_series():
+    # Moves: +1, -0.5, +1, +0.5, -1 with period 3
+    #   bar 3: avg_gain = 2/3,   avg_loss = 1/6   -> RS = 4   -> 80
+    #   bar 4: avg_gain = 11/18, avg_loss = 2/18  -> RS = 5.5 -> 100 - 100 / 6.5
+    #   bar 5: avg_gain = 11/27, avg_loss = 11/27 -> RS = 1   -> 50
+    prices = np.array([10.0, 11.0, 10.5, 11.5, 12.0, 11.0])
+    expected = np.array([np.nan, np.nan, np.nan, 80.0, 100.0 - 100.0 / 6.5, 50.0])
+
+    np.testing.assert_allclose(_rsi_wilder(prices, 3), expected, rtol=0, atol=1e-12)
+
+
+def test_rsi_wilder_flat_prices_are_undefined():
+    rsi = _rsi_wilder(np.full(20, 100.0), 14)
+
+    assert np.isnan(rsi).all()
+    # The analyzer reports a neutral 50 where the kernel has no value
+    analyzer = DetailedAnalyzer(loader=None)
+    assert (analyzer._calculate_rsi(pd.Series(np.full(20, 100.0)), 14) == 50.0).all()
+
+
+def test_rsi_wilder_all_gains_is_100():
+    rsi = _rsi_wilder(np.arange(1.0, 21.0), 14)
+
+    assert np.isnan(rsi[:14]).all()
+    assert (rsi[14:] == 100.0).all()
+
+
+def test_rsi_wilder_needs_more_bars_than_the_period():
+    assert np.isnan(_rsi_wilder(np.arange(1.0, 15.0), 14)).all()
+
+
+def _ragged_closes() -> pd.DataFrame:
+    """Symbols with different history lengths, aligned on one index with NaN padding."""
+    rng = np.random.default_rng(7)
+    n = 80
+
+    def walk(bars):
+        return 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, bars))
+
+    gapped = walk(n)
+    gapped[30] = np.nan
+    return pd.DataFrame({
+        "FULL": walk(n),
+        "SHORT": np.r_[np.full(n - 10, np.nan), walk(10)],  # fewer bars than the RSI period
+        "EDGE": np.r_[np.full(n - 15, np.nan), walk(15)],  # one bar more than the period
+        "MID": np.r_[np.full(n - 30, np.nan), walk(30)],
+        "DELISTED": np.r_[walk(n - 25), np.full(25, np.nan)],
+        "GAPPED": gapped,
+        "EMPTY": np.full(n, np.nan),
+    })
+
+
+def _own_closes(column: pd.Series) -> np.ndarray:
+    """A symbol's history as the single-symbol path sees it, without the alignment padding."""
+    valid = column.notna().to_numpy().nonzero()[0]
+    if not valid.size:
+        return np.empty(0)
+    return column.to_numpy(dtype=np.float64)[valid[0]:valid[-1] + 1]
+
+
+def test_batch_price_stats_rows_match_single_symbol_kernels():
+    closes = _ragged_closes()
+    stats = _batch_price_stats(np.ascontiguousarray(closes.to_numpy(dtype=np.float64).T), 14)
+
+    for j, symbol in enumerate(closes.columns):
+        prices = _own_closes(closes[symbol])
+        expected_rsi = _rsi_wilder(prices, 14)[-1] if len(prices) else np.nan
+        np.testing.assert_allclose(
+            stats[j], [*_price_stats(prices), expected_rsi], rtol=1e-12, atol=0, equal_nan=True, err_msg=symbol
+        )
+
+
+def test_analyze_batch_matches_single_symbol_path():
+    closes = _ragged_closes()
+    analyzer = DetailedAnalyzer(loader=None)
+
+    batch = analyzer.analyze_batch(closes)
+
+    assert list(batch) == list(closes.columns)
+    for symbol in closes.columns:
+        prices = _own_closes(closes[symbol])
+        _, mean_daily, std_daily, _, sma_20, sma_50 = _price_stats(prices)
+        volatility = std_daily * np.sqrt(252)
+        mean_return = mean_daily * 252
+        rsi = _rsi_wilder(prices, 14)[-1] if len(prices) > 14 else 50.0
+        expected = {
+            "volatility": volatility,
+            "mean_return": mean_return,
+            "sharpe_ratio": (mean_return - 0.02) / volatility if volatility > 0 else 0.0,
+            "sma_20": sma_20,
+            "sma_50": sma_50,
+            "rsi": 50.0 if np.isnan(rsi) else rsi,
+            "max_drawdown": analyzer._calculate_max_drawdown(prices),
+        }
+        for key, value in expected.items():
+            assert batch[symbol][key] == pytest.approx(value, rel=1e-12, nan_ok=True), (symbol, key)
@@ -0,0 +1,114 @@
+"""
+Tests for FREDClient's per-series caching of hits and definitive misses.
+"""
+import pytest
+import requests
+
+from src.api_clients import fred_api
+from src.api_clients.fred_api import FREDClient
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._payload = payload if payload is not None else {}
+        self.text = str(self._payload)
+
+    def json(self):
+        return self._payload
+
+
+def _observation(value):
+    return FakeResponse(200, {"observations": [{"value": value}]})
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Serve queued responses from the shared session and count the requests."""
+    fred_api._yield_cache.clear()
+    fred_api._missing_cache.clear()
+    calls = []
+    responses = []
+
+    def get(url, params=None, timeout=None):
+        calls.append(params["series_id"])
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(fred_api._session, "get", get)
+    yield calls, responses
+    fred_api._yield_cache.clear()
+    fred_api._missing_cache.clear()
+
+
+@pytest.mark.parametrize("response", [
+    FakeResponse(503),
+    FakeResponse(500, {"error_message": "Internal Server Error"}),
+    FakeResponse(429),
+    requests.exceptions.ConnectionError("connection reset"),
+    requests.exceptions.Timeout("timed out"),
+])
+def test_transient_failures_are_not_cached(session, response):
+    calls, responses = session
+    client = FREDClient(api_key="test")
+    responses.extend([response, _observation("4.25")])
+
+    assert client._fetch_series_latest("DGS10") is None
+    assert client._fetch_series_latest("DGS10") == pytest.approx(0.0425)
+    assert calls == ["DGS10", "DGS10"]
+
+
+@pytest.mark.parametrize("response", [
+    FakeResponse(400, {"error_message": "Bad Request. The series does not exist."}),
+    FakeResponse(404),
+    _observation("."),
+    _observation("n/a"),
+    FakeResponse(200, {"observations": []}),
+])
+def test_definitive_misses_are_cached(session, response):
+    calls, responses = session
+    client = FREDClient(api_key="test")
+    responses.append(response)
+
+    assert client._fetch_series_latest("DGS20") is None
+    assert client._fetch_series_latest("DGS20") is None
+    assert calls == ["DGS20"]
+
+
+def test_values_are_cached(session):
+    calls, responses = session
+    client = FREDClient(api_key="test")
+    responses.append(_observation("5.01"))
+
+    assert client._fetch_series_latest("DGS1MO") == pytest.approx(0.0501)
+    assert client._fetch_series_latest("DGS1MO") == pytest.approx(0.0501)
+    assert calls == ["DGS1MO"]
+
+
+def test_session_retries_transient_server_errors():
+    adapter = fred_api._session.get_adapter(FREDClient.BASE_URL)
+
+    assert adapter._pool_maxsize == len(fred_api.TREASURY_SERIES)
+    assert adapter.max_retries.total == 2
+    assert set(adapter.max_retries.status_forcelist) == {500, 502, 503, 504}
+    # The final 5xx is returned rather than raised, so it reaches the transient path
+    assert adapter.max_retries.raise_on_status is False
+
+
+def test_requests_use_split_connect_and_read_timeouts(session, monkeypatch):
+    calls, responses = session
+    timeouts = []
+    get = fred_api._session.get
+
+    def recording_get(url, params=None, timeout=None):
+        timeouts.append(timeout)
+        return get(url, params=params, timeout=timeout)
+
+    monkeypatch.setattr(fred_api._session, "get", recording_get)
+    responses.append(_observation("4.00"))
+
+    FREDClient(api_key="test")._fetch_series_latest("DGS5")
+
+    assert timeouts == [(3, 5)]
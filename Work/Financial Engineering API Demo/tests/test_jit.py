@@ -0,0 +1,31 @@
+"""
+Tests for the optional Numba helpers.
+"""
+import subprocess
+import sys
+
+import pytest
+
+from src.utils.jit import NUMBA_AVAILABLE
+
+from conftest import APP_DIR
+
+# First parallel kernel launch from a worker thread, then a normal interpreter exit
+PARALLEL_FROM_THREAD = """
+import threading
+import numpy as np
+from src.analysis.detailed_analyzer import _batch_price_stats
+
+t = threading.Thread(target=_batch_price_stats, args=(np.linspace(1.0, 2.0, 120).reshape(2, 60), 14))
+t.start()
+t.join()
+"""
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+def test_parallel_kernel_started_from_a_thread_does_not_hang_exit():
+    result = subprocess.run(
+        [sys.executable, "-c", PARALLEL_FROM_THREAD], cwd=APP_DIR, timeout=60, capture_output=True
+    )
+
+    assert result.returncode == 0, result.stderr.decode()
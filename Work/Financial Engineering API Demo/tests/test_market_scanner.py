@@ -0,0 +1,82 @@
+"""
+Tests for MarketScanner's single-group and batched scans, using in-memory
+quotes and history instead of live data.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.trading.market_scanner import MarketScanner
+
+GROUPS = [
+    (["AAPL", "MSFT", "XOM"], "stock", 0.5),
+    (["BTC-USD", "ETH-USD"], "crypto", 0.25),
+    (["EURUSD=X"], "forex", 0.25),
+]
+
+
+class FakeQuotes:
+    def get_quotes_batch(self, symbols):
+        return {symbol: {"price": 100.0 + len(symbol)} for symbol in symbols}
+
+    def get_quote(self, symbol):
+        return {"price": 100.0 + len(symbol)}
+
+
+class FakeHistory:
+    def fetch_historical_data_batch(self, symbols, asset_type, years=1.0, use_cache=True):
+        return {symbol: self.fetch_historical_data(symbol, asset_type, years) for symbol in symbols}
+
+    def fetch_historical_data(self, symbol, asset_type, years=1.0, use_cache=True):
+        # A different trend per symbol so the quick scan gives a mix of signals
+        slope = (sum(map(ord, symbol)) % 7 - 3) * 0.2
+        return pd.DataFrame({"close": 100.0 + slope * np.arange(60)})
+
+
+@pytest.fixture
+def scanner():
+    scanner = MarketScanner(data_loader=object(), historical_fetcher=FakeHistory(), max_workers=4)
+    scanner.yahoo_client = FakeQuotes()
+    return scanner
+
+
+def _comparable(opportunities):
+    return sorted(
+        ({k: v for k, v in opp.items() if k != "timestamp"} for opp in opportunities),
+        key=lambda opp: opp["symbol"],
+    )
+
+
+def test_batched_scan_matches_per_group_scans(scanner):
+    batched = scanner.scan_stocks_batched(GROUPS, min_confidence=0.0, full_analysis=False)
+
+    assert set(batched) == {"stock", "crypto", "forex"}
+    for symbols, asset_type, years in GROUPS:
+        single = scanner.scan_stocks(
+            symbols, min_confidence=0.0, asset_type=asset_type, full_analysis=False, historical_years=years
+        )
+        assert len(single) == len(symbols)
+        assert _comparable(batched[asset_type]) == _comparable(single)
+
+
+def test_failed_group_is_left_out_of_batched_results(scanner, monkeypatch):
+    fetch_group_history = scanner._fetch_group_history
+
+    def failing_for_crypto(symbols, asset_type, historical_years):
+        if asset_type == "crypto":
+            raise RuntimeError("crypto feed down")
+        return fetch_group_history(symbols, asset_type, historical_years)
+
+    monkeypatch.setattr(scanner, "_fetch_group_history", failing_for_crypto)
+
+    batched = scanner.scan_stocks_batched(GROUPS, min_confidence=0.0, full_analysis=False)
+
+    assert set(batched) == {"stock", "forex"}
+    assert sorted(opp["symbol"] for opp in batched["stock"]) == ["AAPL", "MSFT", "XOM"]
+    assert [opp["symbol"] for opp in batched["forex"]] == ["EURUSD=X"]
+
+
+def test_group_with_no_opportunities_is_still_reported(scanner):
+    batched = scanner.scan_stocks_batched(GROUPS, min_confidence=1.0, full_analysis=False)
+
+    assert batched == {"stock": [], "crypto": [], "forex": []}
@@ -0,0 +1,108 @@
+"""
+Tests for PortfolioAnalyzer against the pandas implementation it replaced.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.portfolio import PortfolioAnalyzer
+
+SYMBOLS = ["AAA", "BBB", "CCC"]
+WEIGHTS = [0.5, 0.3, 0.2]
+
+
+def _prices(gaps: bool = False) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    closes = 100.0 * np.cumprod(1.0 + rng.normal(0.0005, 0.015, (60, len(SYMBOLS))), axis=0)
+    if gaps:
+        closes[7, 0] = np.nan
+        closes[20:23, 1] = np.nan
+        closes[41, 2] = np.nan
+    return pd.DataFrame(closes, columns=SYMBOLS, index=pd.date_range("2024-01-01", periods=60, freq="B"))
+
+
+def _baseline_returns(prices, weights):
+    return (prices.pct_change().dropna() * np.asarray(weights)).sum(axis=1)
+
+
+def _baseline_risk_metrics(returns, risk_free_rate=0.02):
+    annual_returns = returns.mean() * 252
+    annual_volatility = returns.std() * np.sqrt(252)
+    cumulative = (1 + returns).cumprod()
+    running_max = cumulative.expanding().max()
+    var_95 = np.percentile(returns, 5)
+    return {
+        "annual_return": annual_returns,
+        "annual_volatility": annual_volatility,
+        "sharpe_ratio": (annual_returns - risk_free_rate) / annual_volatility,
+        "max_drawdown": ((cumulative - running_max) / running_max).min(),
+        "var_95": var_95,
+        "cvar_95": returns[returns <= var_95].mean(),
+        "skewness": returns.skew(),
+        "kurtosis": returns.kurtosis(),
+    }
+
+
+@pytest.mark.parametrize("gaps", [False, True])
+def test_calculate_returns_matches_pct_change(gaps):
+    prices = _prices(gaps)
+
+    returns = PortfolioAnalyzer(SYMBOLS, WEIGHTS).calculate_returns(prices)
+    expected = _baseline_returns(prices, WEIGHTS)
+
+    pd.testing.assert_index_equal(returns.index, expected.index)
+    np.testing.assert_allclose(returns.to_numpy(), expected.to_numpy(), rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.parametrize("returns", [
+    pd.Series(np.random.default_rng(3).normal(0.0004, 0.012, 250)),
+    pd.Series(np.random.default_rng(4).standard_t(3, 41) * 0.01),
+    pd.Series([0.01, -0.02, 0.005, 0.03]),
+    pd.Series([0.01, -0.02, 0.005]),
+    pd.Series([0.002] * 30),
+])
+def test_risk_metrics_match_pandas(returns):
+    metrics = PortfolioAnalyzer(SYMBOLS, WEIGHTS).calculate_risk_metrics(returns)
+    expected = _baseline_risk_metrics(returns)
+
+    assert list(metrics) == list(expected)
+    for key, value in expected.items():
+        assert metrics[key] == pytest.approx(float(value), rel=1e-9, abs=1e-15, nan_ok=True), key
+
+
+@pytest.mark.parametrize("gaps", [False, True])
+def test_risk_metrics_of_gapped_prices_match_pandas(gaps):
+    prices = _prices(gaps)
+    analyzer = PortfolioAnalyzer(SYMBOLS, WEIGHTS)
+
+    metrics = analyzer.calculate_risk_metrics(analyzer.calculate_returns(prices))
+    expected = _baseline_risk_metrics(_baseline_returns(prices, WEIGHTS))
+
+    for key, value in expected.items():
+        assert metrics[key] == pytest.approx(float(value), rel=1e-9, nan_ok=True), key
+
+
+@pytest.mark.parametrize("gaps", [False, True])
+def test_correlation_matches_pandas(gaps):
+    prices = _prices(gaps)
+    prices["FLAT"] = 50.0  # zero variance: undefined correlation in both paths
+
+    analyzer = PortfolioAnalyzer(SYMBOLS + ["FLAT"], [0.4, 0.3, 0.2, 0.1])
+    corr = pd.DataFrame(analyzer.analyze_portfolio(prices)["correlation_matrix"])
+    expected = prices.pct_change().corr()
+
+    pd.testing.assert_index_equal(corr.index, expected.index)
+    pd.testing.assert_index_equal(corr.columns, expected.columns)
+    np.testing.assert_allclose(corr.to_numpy(), expected.to_numpy(), rtol=1e-12, atol=1e-15, equal_nan=True)
+
+
+@pytest.mark.parametrize("gaps", [False, True])
+def test_analyze_portfolio_return_summary_matches_pandas(gaps):
+    prices = _prices(gaps)
+
+    summary = PortfolioAnalyzer(SYMBOLS, WEIGHTS).analyze_portfolio(prices)["returns"]
+    returns = _baseline_returns(prices, WEIGHTS)
+
+    assert summary["total_return"] == pytest.approx(float((1 + returns).prod() - 1), rel=1e-12)
+    assert summary["daily_mean"] == pytest.approx(float(returns.mean()), rel=1e-12)
+    assert summary["daily_std"] == pytest.approx(float(returns.std()), rel=1e-12)
@@ -0,0 +1,88 @@
+"""
+Tests for the watchlist endpoints' debounced writes and mtime-based reloads.
+"""
+import os
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import api_service
+
+
+@pytest.fixture
+def watchlist_file(tmp_path, monkeypatch):
+    """Point the watchlist at a temp file and reset the in-memory state; yields (path, writes)."""
+    path = tmp_path / "data" / "watchlist.json"
+    monkeypatch.setattr(api_service, "WATCHLIST_FILE", str(path))
+    monkeypatch.setattr(api_service, "_watchlist", [])
+    monkeypatch.setattr(api_service, "_watchlist_upper", set())
+    monkeypatch.setattr(api_service, "_watchlist_loaded", False)
+    monkeypatch.setattr(api_service, "_watchlist_mtime_ns", None)
+    monkeypatch.setattr(api_service, "_watchlist_flush_timer", None)
+
+    writes = []
+    atomic_write_json = api_service._atomic_write_json
+
+    def counting_write(target, data):
+        writes.append(list(data))
+        atomic_write_json(target, data)
+
+    monkeypatch.setattr(api_service, "_atomic_write_json", counting_write)
+    yield path, writes
+    timer = api_service._watchlist_flush_timer
+    if timer is not None:
+        timer.cancel()
+
+
+def _wait_for_flush():
+    timer = api_service._watchlist_flush_timer
+    if timer is not None:
+        timer.join(5)
+
+
+def test_rapid_adds_coalesce_into_one_write(watchlist_file, monkeypatch):
+    watchlist_file, writes = watchlist_file
+    monkeypatch.setattr(api_service, "WATCHLIST_FLUSH_DELAY_SECONDS", 0.2)
+    client = TestClient(api_service.app)
+
+    for symbol in ("aapl", "msft", "nvda", "AAPL", "tsla"):
+        assert client.post("/api/watchlist", params={"symbol": symbol}).status_code == 200
+    assert writes == []
+
+    _wait_for_flush()
+
+    assert writes == [["AAPL", "MSFT", "NVDA", "TSLA"]]
+    assert orjson.loads(watchlist_file.read_bytes()) == ["AAPL", "MSFT", "NVDA", "TSLA"]
+
+
+def test_external_edit_is_picked_up(watchlist_file):
+    watchlist_file, writes = watchlist_file
+    watchlist_file.parent.mkdir(parents=True)
+    watchlist_file.write_bytes(orjson.dumps(["spy"]))
+    client = TestClient(api_service.app)
+    assert client.get("/api/watchlist").json()["watchlist"] == ["SPY"]
+
+    watchlist_file.write_bytes(orjson.dumps(["qqq", "iwm"]))
+    # Make sure the edit is visible even on filesystems with coarse timestamps
+    stat = watchlist_file.stat()
+    os.utime(watchlist_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert client.get("/api/watchlist").json()["watchlist"] == ["QQQ", "IWM"]
+    assert writes == []
+
+
+def test_pending_write_is_flushed_on_shutdown(watchlist_file, monkeypatch):
+    watchlist_file, writes = watchlist_file
+    # Long enough that only the shutdown hook can have written the file
+    monkeypatch.setattr(api_service, "WATCHLIST_FLUSH_DELAY_SECONDS", 60)
+
+    with TestClient(api_service.app) as client:
+        client.post("/api/watchlist", params={"symbol": "gld"})
+        client.delete("/api/watchlist/gld")
+        client.post("/api/watchlist", params={"symbol": "slv"})
+        assert not watchlist_file.exists()
+
+    assert writes == [["SLV"]]
+    assert orjson.loads(watchlist_file.read_bytes()) == ["SLV"]
+    assert api_service._watchlist_flush_timer is None
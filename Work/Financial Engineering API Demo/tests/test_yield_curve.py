@@ -0,0 +1,71 @@
+"""
+Tests for YieldCurve discount factors and index-built curves.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from src.analysis.yield_curve import CurveFactory
+from src.analysis.yield_curve.indexes import IndexCurveFactory, IndexRegistry
+from src.analysis.yield_curve.indexes.index_bootstrapper import IndexBootstrapper
+
+TENORS = [0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.0, 10.0, 20.0, 30.0]
+RATES = [0.0525, 0.0531, 0.0508, 0.0469, 0.0447, 0.0431, 0.0428, 0.0425, 0.0451, 0.0443]
+
+
+@pytest.mark.parametrize("interpolation", ["cubic_spline", "linear"])
+@pytest.mark.parametrize("tenor", [
+    0.1,            # before the first pillar
+    0.25, 5.0, 30.0,  # pillars
+    5.0 + 1e-9,     # within np.isclose of a pillar
+    0.75, 4.3, 12.5, 29.9,  # interior
+    35.0,           # after the last pillar
+])
+def test_continuous_discount_factor_matches_spot_rate(interpolation, tenor):
+    curve = CurveFactory.create_spot_curve(
+        tenors=TENORS, rates=RATES, interpolation=interpolation, compounding="continuous"
+    )
+
+    expected = math.exp(-curve.spot_rate(tenor) * tenor)
+
+    assert curve.discount_factor(tenor) == pytest.approx(expected, rel=1e-14)
+    assert curve.discount_factors(np.array([tenor]))[0] == pytest.approx(expected, rel=1e-14)
+
+
+def _baseline_index_curve(index_code, index_rates, interpolation):
+    """The bootstrap() path create_from_index used before the array fast path."""
+    index_def = IndexRegistry.get(index_code)
+    tenors, rates = IndexBootstrapper().bootstrap([{**rate, "index": index_code} for rate in index_rates])
+    return CurveFactory.create_spot_curve(
+        tenors=tenors.tolist(),
+        rates=rates.tolist(),
+        interpolation=interpolation,
+        day_count=index_def.day_count,
+        compounding=index_def.compounding,
+    )
+
+
+def _outcome(build):
+    try:
+        curve = build()
+    except Exception as exc:
+        return type(exc), str(exc)
+    return curve.tenors.tolist(), curve.rates.tolist(), type(curve.compounding), type(curve.day_count)
+
+
+@pytest.mark.parametrize("interpolation", ["cubic_spline", "linear"])
+@pytest.mark.parametrize("index_rates", [
+    [{"tenor": 2.0, "rate": 0.041}, {"tenor": 0.25, "rate": 0.053}, {"maturity": 1.0, "rate": 0.048}],
+    # Duplicate and near-duplicate tenors are passed through as before, not merged
+    [{"tenor": 1.0, "rate": 0.048}, {"tenor": 0.5, "rate": 0.05}, {"tenor": 1.0, "rate": 0.049}],
+    [{"tenor": 1.0, "rate": 0.048}, {"tenor": 1.0 + 1e-12, "rate": 0.049}, {"tenor": 3.0, "rate": 0.045}],
+    [{"tenor": 0.5, "rate": 0.05}, {"tenor": 0.0, "rate": 0.05}],
+    [{"tenor": 0.5, "rate": 0.05}, {"rate": 0.05}],
+    [],
+])
+def test_single_index_curve_matches_bootstrap_path(interpolation, index_rates):
+    fast = _outcome(lambda: IndexCurveFactory.create_from_index("SOFR", index_rates, interpolation=interpolation))
+    baseline = _outcome(lambda: _baseline_index_curve("SOFR", index_rates, interpolation))
+
+    assert fast == baseline